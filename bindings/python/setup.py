@@ -0,0 +1,58 @@
+"""Build configuration for the optional compiled accelerator.
+
+Project metadata lives in pyproject.toml. The ``unpdf._accel`` extension is
+opt-in: it is only built when ``UNPDF_BUILD_ACCEL=1`` is set, because a
+compiled extension turns the package into a platform- and Python-specific
+wheel. The published wheel bundles every native runtime and must stay a pure
+``py3-none-any`` wheel, so CI builds it without the flag. Even when requested
+the extension is marked optional: without a C compiler the build still
+succeeds and the bindings fall back to the pure ctypes path.
+
+When the package bundles exactly one native runtime (a platform-specific
+wheel), its location is recorded in a generated ``unpdf/_lib_path.py`` so the
+bindings can load it without platform detection. Builds that bundle several
+runtimes, or none, skip the file and keep detecting at runtime.
+"""
+
+import os
+from pathlib import Path
+
+from setuptools import Extension, setup
+from setuptools.command.build_py import build_py
+
+# Library filenames, as in unpdf/_native.py
+LIB_NAMES = ("libunpdf.so", "libunpdf.dylib", "unpdf.dll")
+
+
+class BuildPy(build_py):
+    """build_py that also generates ``unpdf/_lib_path.py``."""
+
+    def run(self):
+        super().run()
+        package_dir = Path(self.build_lib) / "unpdf"
+        target = package_dir / "_lib_path.py"
+        libs = [p for p in (package_dir / "lib").glob("*/*") if p.name in LIB_NAMES]
+        if len(libs) == 1:
+            relative = libs[0].relative_to(package_dir).as_posix()
+            target.write_text(
+                '"""Generated at build time by setup.py. Do not edit."""\n\n'
+                f"LIB_RELATIVE = {relative!r}\n"
+            )
+        elif target.exists():
+            target.unlink()
+
+
+ext_modules = []
+if os.environ.get("UNPDF_BUILD_ACCEL") == "1":
+    ext_modules.append(
+        Extension(
+            "unpdf._accel",
+            sources=["src/unpdf/_accel.c"],
+            optional=True,
+        )
+    )
+
+setup(
+    cmdclass={"build_py": BuildPy},
+    ext_modules=ext_modules,
+)
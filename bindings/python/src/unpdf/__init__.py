@@ -1,23 +1,44 @@
 """
 unpdf - Python bindings for unpdf PDF extraction library.
+
+The native library is loaded on first use of the API, so ``import unpdf``
+itself is cheap.
 """
 
-from .unpdf import (
-    to_markdown,
-    to_text,
-    to_json,
-    get_info,
-    get_extraction_quality,
-    get_page_stats,
-    get_page_count,
-    is_pdf,
-    version,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .unpdf import (
+        Document,
+        open,
+        to_markdown,
+        to_text,
+        to_json,
+        to_markdown_bytes,
+        to_text_bytes,
+        to_json_bytes,
+        to_markdown_batch,
+        to_text_batch,
+        to_json_batch,
+        get_info,
+        get_extraction_quality,
+        get_page_stats,
+        get_page_count,
+        is_pdf,
+        version,
+    )
 
 __all__ = [
+    "Document",
     "to_markdown",
     "to_text",
     "to_json",
+    "to_markdown_bytes",
+    "to_text_bytes",
+    "to_json_bytes",
+    "to_markdown_batch",
+    "to_text_batch",
+    "to_json_batch",
     "get_info",
     "get_extraction_quality",
     "get_page_stats",
@@ -25,3 +46,21 @@ __all__ = [
     "is_pdf",
     "version",
 ]
+
+# Public, but kept out of __all__ so ``from unpdf import *`` does not shadow
+# the builtin open(). Use it as ``unpdf.open(path)``.
+_NOT_STARRED = ("open",)
+
+
+def __getattr__(name: str):
+    if name in __all__ or name in _NOT_STARRED:
+        from . import unpdf as _api
+
+        value = getattr(_api, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | set(_NOT_STARRED))
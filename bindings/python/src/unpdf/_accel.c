@@ -0,0 +1,272 @@
+/*
+ * Optional compiled fast path for the unpdf Python bindings.
+ *
+ * The native library is still located and loaded by _native.py through
+ * ctypes; this module only receives the addresses of the C-ABI entry points
+ * (see bindings/unpdf.h) via bind() and exposes the one-shot conversions,
+ * and rendering of an already parsed document handle (Document methods), as
+ * METH_FASTCALL functions. That removes the libffi dispatch and ctypes
+ * argument/result marshalling from every call, and keeps this module free of
+ * any link-time dependency on libunpdf. The GIL is released around the native
+ * work, as ctypes does for each individual call.
+ *
+ * When this extension is not built, unpdf.py falls back to plain ctypes.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <stdint.h>
+
+/* Function pointer types mirroring bindings/unpdf.h. */
+typedef void *(*unpdf_parse_file_fn)(const char *path);
+typedef void (*unpdf_free_document_fn)(void *doc);
+typedef char *(*unpdf_to_markdown_buf_fn)(const void *doc, uint32_t flags, size_t *out_len);
+typedef char *(*unpdf_to_text_buf_fn)(const void *doc, size_t *out_len);
+typedef char *(*unpdf_to_json_buf_fn)(const void *doc, int format, size_t *out_len);
+typedef void (*unpdf_free_string_fn)(char *s);
+typedef const char *(*unpdf_last_error_fn)(void);
+
+static struct {
+    unpdf_parse_file_fn parse_file;
+    unpdf_free_document_fn free_document;
+    unpdf_to_markdown_buf_fn to_markdown_buf;
+    unpdf_to_text_buf_fn to_text_buf;
+    unpdf_to_json_buf_fn to_json_buf;
+    unpdf_free_string_fn free_string;
+    unpdf_last_error_fn last_error;
+} api;
+
+/* Output modes; the values match UNPDF_BATCH_* in unpdf.h. */
+enum convert_mode {
+    CONVERT_MARKDOWN = 0,
+    CONVERT_TEXT = 1,
+    CONVERT_JSON = 2,
+};
+
+static int
+check_nargs(const char *name, Py_ssize_t nargs, Py_ssize_t expected)
+{
+    if (nargs != expected) {
+        PyErr_Format(PyExc_TypeError, "%s() takes exactly %zd arguments (%zd given)",
+                     name, expected, nargs);
+        return 0;
+    }
+    return 1;
+}
+
+static int
+check_bound(void)
+{
+    if (api.parse_file == NULL) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "unpdf accelerator is not bound to the native library");
+        return 0;
+    }
+    return 1;
+}
+
+static PyObject *
+raise_last_error(void)
+{
+    const char *err = api.last_error();
+    PyErr_Format(PyExc_RuntimeError, "unpdf error: %s", err ? err : "Unknown error");
+    return NULL;
+}
+
+/*
+ * Decode an owned native string of `len` bytes straight into a str (no
+ * intermediate bytes object) and release it.
+ */
+static PyObject *
+take_string(char *s, size_t len)
+{
+    PyObject *result;
+
+    if (s == NULL) {
+        return raise_last_error();
+    }
+    result = PyUnicode_DecodeUTF8(s, (Py_ssize_t)len, "strict");
+    api.free_string(s);
+    return result;
+}
+
+/* Render a parsed document. Called without the GIL. */
+static char *
+render_document(void *doc, enum convert_mode mode, long arg, size_t *len)
+{
+    switch (mode) {
+    case CONVERT_MARKDOWN:
+        return api.to_markdown_buf(doc, (uint32_t)arg, len);
+    case CONVERT_TEXT:
+        return api.to_text_buf(doc, len);
+    case CONVERT_JSON:
+        return api.to_json_buf(doc, (int)arg, len);
+    }
+    return NULL;
+}
+
+static PyObject *
+convert(const char *name, PyObject *const *args, Py_ssize_t nargs, enum convert_mode mode)
+{
+    const char *path;
+    long arg = 0;
+    void *doc;
+    char *out = NULL;
+    size_t len = 0;
+
+    if (!check_nargs(name, nargs, mode == CONVERT_TEXT ? 1 : 2) || !check_bound()) {
+        return NULL;
+    }
+    if (!PyBytes_Check(args[0])) {
+        PyErr_Format(PyExc_TypeError, "%s() path must be bytes", name);
+        return NULL;
+    }
+    path = PyBytes_AS_STRING(args[0]);
+    if (mode != CONVERT_TEXT) {
+        arg = PyLong_AsLong(args[1]);
+        if (arg == -1 && PyErr_Occurred()) {
+            return NULL;
+        }
+    }
+
+    /*
+     * Parse, render and free without the GIL so other threads keep running.
+     * `path` stays valid: the caller holds a reference to the bytes object.
+     * The error message is thread-local on the native side, so it can still
+     * be read once the GIL is re-acquired.
+     */
+    Py_BEGIN_ALLOW_THREADS
+    doc = api.parse_file(path);
+    if (doc != NULL) {
+        out = render_document(doc, mode, arg, &len);
+        api.free_document(doc);
+    }
+    Py_END_ALLOW_THREADS
+
+    if (doc == NULL) {
+        return raise_last_error();
+    }
+    return take_string(out, len);
+}
+
+static PyObject *
+accel_to_markdown(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    return convert("to_markdown", args, nargs, CONVERT_MARKDOWN);
+}
+
+static PyObject *
+accel_to_text(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    return convert("to_text", args, nargs, CONVERT_TEXT);
+}
+
+static PyObject *
+accel_to_json(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    return convert("to_json", args, nargs, CONVERT_JSON);
+}
+
+static PyObject *
+accel_render(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    void *doc;
+    long mode;
+    long arg;
+    char *out;
+    size_t len = 0;
+
+    if (!check_nargs("render", nargs, 3) || !check_bound()) {
+        return NULL;
+    }
+    doc = PyLong_AsVoidPtr(args[0]);
+    if (doc == NULL) {
+        if (!PyErr_Occurred()) {
+            PyErr_SetString(PyExc_ValueError, "render() document handle is null");
+        }
+        return NULL;
+    }
+    mode = PyLong_AsLong(args[1]);
+    if (mode == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    if (mode < CONVERT_MARKDOWN || mode > CONVERT_JSON) {
+        PyErr_Format(PyExc_ValueError, "render() unknown mode %ld", mode);
+        return NULL;
+    }
+    arg = PyLong_AsLong(args[2]);
+    if (arg == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+
+    /*
+     * The handle must stay valid while the GIL is released: Document borrows
+     * it for the duration of the call, and Document.close() waits for all
+     * borrowers before freeing it.
+     */
+    Py_BEGIN_ALLOW_THREADS
+    out = render_document(doc, (enum convert_mode)mode, arg, &len);
+    Py_END_ALLOW_THREADS
+
+    return take_string(out, len);
+}
+
+static PyObject *
+accel_bind(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    void *ptrs[7];
+    Py_ssize_t i;
+
+    if (!check_nargs("bind", nargs, 7)) {
+        return NULL;
+    }
+    for (i = 0; i < nargs; i++) {
+        ptrs[i] = PyLong_AsVoidPtr(args[i]);
+        if (ptrs[i] == NULL) {
+            if (!PyErr_Occurred()) {
+                PyErr_Format(PyExc_ValueError, "bind() argument %zd is a null pointer", i + 1);
+            }
+            return NULL;
+        }
+    }
+
+    api.parse_file = (unpdf_parse_file_fn)ptrs[0];
+    api.free_document = (unpdf_free_document_fn)ptrs[1];
+    api.to_markdown_buf = (unpdf_to_markdown_buf_fn)ptrs[2];
+    api.to_text_buf = (unpdf_to_text_buf_fn)ptrs[3];
+    api.to_json_buf = (unpdf_to_json_buf_fn)ptrs[4];
+    api.free_string = (unpdf_free_string_fn)ptrs[5];
+    api.last_error = (unpdf_last_error_fn)ptrs[6];
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef accel_methods[] = {
+    {"bind", (PyCFunction)(void (*)(void))accel_bind, METH_FASTCALL,
+     "bind(parse_file, free_document, to_markdown_buf, to_text_buf, to_json_buf, free_string, "
+     "last_error)\n--\n\nBind the accelerator to the addresses of the native entry points."},
+    {"to_markdown", (PyCFunction)(void (*)(void))accel_to_markdown, METH_FASTCALL,
+     "to_markdown(path, flags)\n--\n\nParse the file at `path` (bytes) and render Markdown."},
+    {"to_text", (PyCFunction)(void (*)(void))accel_to_text, METH_FASTCALL,
+     "to_text(path)\n--\n\nParse the file at `path` (bytes) and render plain text."},
+    {"to_json", (PyCFunction)(void (*)(void))accel_to_json, METH_FASTCALL,
+     "to_json(path, format)\n--\n\nParse the file at `path` (bytes) and render JSON."},
+    {"render", (PyCFunction)(void (*)(void))accel_render, METH_FASTCALL,
+     "render(handle, mode, arg)\n--\n\nRender a parsed document handle. `mode` is a "
+     "UNPDF_BATCH_* value; `arg` is its flags or JSON format."},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef accel_module = {
+    PyModuleDef_HEAD_INIT,
+    "_accel",
+    "Compiled fast path for the unpdf C-ABI.",
+    -1,
+    accel_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__accel(void)
+{
+    return PyModule_Create(&accel_module);
+}
@@ -1,10 +1,14 @@
 """Native library loading for unpdf."""
 
 import ctypes
+import functools
 import platform
 import os
-import subprocess
+import struct
+import sys
+import threading
 from pathlib import Path
+from typing import Optional
 
 # Library filename by platform
 _LIB_NAMES = {
@@ -14,26 +18,79 @@ _LIB_NAMES = {
 }
 
 
-def _is_musl() -> bool:
-    """Detect if the current Linux system uses musl libc."""
-    # Check if /etc/os-release indicates Alpine
+# ELF program header type of the dynamic-linker path (PT_INTERP).
+_PT_INTERP = 3
+
+
+def _elf_interpreter(path: str = sys.executable) -> Optional[str]:
+    """Return the dynamic linker requested by an ELF executable.
+
+    Reads the ELF and program headers directly (a few small reads, no
+    subprocess). Returns None for non-ELF files and static executables.
+    """
     try:
-        osrelease = Path("/etc/os-release").read_text()
-        if "alpine" in osrelease.lower():
-            return True
-    except OSError:
-        pass
-    # Check ldd version output (musl ldd identifies itself)
+        with open(path, "rb") as f:
+            ident = f.read(64)
+            if len(ident) < 52 or ident[:4] != b"\x7fELF":
+                return None
+            is_64 = ident[4] == 2
+            endian = "<" if ident[5] == 1 else ">"
+            if is_64:
+                (phoff,) = struct.unpack_from(endian + "Q", ident, 0x20)
+                phentsize, phnum = struct.unpack_from(endian + "HH", ident, 0x36)
+                # p_type, p_flags, p_offset, p_vaddr, p_paddr, p_filesz
+                ph_format = struct.Struct(endian + "IIQQQQ")
+            else:
+                (phoff,) = struct.unpack_from(endian + "I", ident, 0x1C)
+                phentsize, phnum = struct.unpack_from(endian + "HH", ident, 0x2A)
+                # p_type, p_offset, p_vaddr, p_paddr, p_filesz
+                ph_format = struct.Struct(endian + "IIIII")
+            f.seek(phoff)
+            headers = f.read(phentsize * phnum)
+            for i in range(phnum):
+                fields = ph_format.unpack_from(headers, i * phentsize)
+                if fields[0] == _PT_INTERP:
+                    p_offset = fields[2] if is_64 else fields[1]
+                    f.seek(p_offset)
+                    return f.read(fields[-1]).split(b"\0", 1)[0].decode("ascii", "replace")
+    except (OSError, struct.error):
+        return None
+    return None
+
+
+def _os_release_ids(path: str = "/etc/os-release") -> set[str]:
+    """Return the lower-cased ``ID`` and ``ID_LIKE`` values from os-release."""
     try:
-        result = subprocess.run(
-            ["ldd", "--version"], capture_output=True, text=True, timeout=5
-        )
-        output = result.stdout + result.stderr
-        if "musl" in output.lower():
-            return True
-    except (OSError, subprocess.TimeoutExpired):
-        pass
-    return False
+        text = Path(path).read_text()
+    except OSError:
+        return set()
+    ids: set[str] = set()
+    for line in text.splitlines():
+        key, _, value = line.partition("=")
+        if key.strip() in ("ID", "ID_LIKE"):
+            ids.update(value.strip().strip("\"'").lower().split())
+    return ids
+
+
+@functools.lru_cache(maxsize=1)
+def _is_musl() -> bool:
+    """Detect if the current Linux system uses musl libc."""
+    # CPython records its target triplet at build time. A musl triplet answers
+    # without any I/O; a gnu one does not, because CPython before 3.13 also
+    # reports x86_64-linux-gnu on musl (e.g. Alpine's python3).
+    libc = getattr(sys.implementation, "_multiarch", "").rpartition("-")[2]
+    if libc.startswith("musl"):
+        return True
+    # The interpreter's own dynamic linker is authoritative: ld-musl-* vs
+    # ld-linux-* (glibc).
+    interp = _elf_interpreter()
+    if interp:
+        return "musl" in interp
+    # Static or unreadable interpreter binary: look for the musl loader, then
+    # fall back to the distribution.
+    if any(Path("/lib").glob("ld-musl-*")):
+        return True
+    return "alpine" in _os_release_ids()
 
 
 def _get_linux_runtime_id(machine: str) -> str:
@@ -52,15 +109,21 @@ _RUNTIME_IDS = {
 }
 
 
-def _get_lib_path() -> Path:
-    """Get the path to the native library."""
+@functools.lru_cache(maxsize=1)
+def _get_runtime_id() -> str:
+    """Get the runtime ID (``lib/<runtime_id>``) for the current platform."""
     system = platform.system()
     machine = platform.machine()
+    if system == "Linux":
+        return _get_linux_runtime_id(machine)
+    runtime_id = _RUNTIME_IDS.get((system, machine))
+    if not runtime_id:
+        raise OSError(f"Unsupported architecture: {system}/{machine}")
+    return runtime_id
 
-    lib_name = _LIB_NAMES.get(system)
-    if not lib_name:
-        raise OSError(f"Unsupported platform: {system}")
 
+def _get_lib_path() -> Path:
+    """Get the path to the native library."""
     # Check UNPDF_LIB_PATH environment variable first
     env_path = os.environ.get("UNPDF_LIB_PATH")
     if env_path:
@@ -68,12 +131,21 @@ def _get_lib_path() -> Path:
         if p.exists():
             return p
 
-    if system == "Linux":
-        runtime_id = _get_linux_runtime_id(machine)
+    # Platform-specific wheels record their single bundled runtime at build
+    # time (see setup.py); no detection needed.
+    try:
+        from ._lib_path import LIB_RELATIVE
+    except ImportError:
+        pass
     else:
-        runtime_id = _RUNTIME_IDS.get((system, machine))
-        if not runtime_id:
-            raise OSError(f"Unsupported architecture: {system}/{machine}")
+        return Path(os.path.join(os.path.dirname(__file__), LIB_RELATIVE))
+
+    system = platform.system()
+    lib_name = _LIB_NAMES.get(system)
+    if not lib_name:
+        raise OSError(f"Unsupported platform: {system}")
+
+    runtime_id = _get_runtime_id()
 
     # Look for the library in the package
     package_dir = Path(__file__).parent
@@ -100,6 +172,8 @@ def _load_library() -> ctypes.CDLL:
     """Load the native unpdf library."""
     lib_path = _get_lib_path()
 
+    # CDLL (not PyDLL) releases the GIL for the duration of every native
+    # call, so parsing in one thread does not block the others.
     try:
         if platform.system() == "Windows":
             # On Windows, use LoadLibraryEx with LOAD_WITH_ALTERED_SEARCH_PATH
@@ -113,83 +187,166 @@ def _load_library() -> ctypes.CDLL:
         ) from e
 
 
-# Load the library eagerly
-_lib = _load_library()
-
-# Define function signatures
-_lib.unpdf_version.argtypes = []
-_lib.unpdf_version.restype = ctypes.c_char_p
-
-_lib.unpdf_last_error.argtypes = []
-_lib.unpdf_last_error.restype = ctypes.c_char_p
-
-_lib.unpdf_parse_file.argtypes = [ctypes.c_char_p]
-_lib.unpdf_parse_file.restype = ctypes.c_void_p
-
-_lib.unpdf_parse_bytes.argtypes = [ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t]
-_lib.unpdf_parse_bytes.restype = ctypes.c_void_p
-
-_lib.unpdf_free_document.argtypes = [ctypes.c_void_p]
-_lib.unpdf_free_document.restype = None
-
-_lib.unpdf_to_markdown.argtypes = [ctypes.c_void_p, ctypes.c_int]
-_lib.unpdf_to_markdown.restype = ctypes.c_char_p
-
-_lib.unpdf_to_text.argtypes = [ctypes.c_void_p]
-_lib.unpdf_to_text.restype = ctypes.c_char_p
-
-_lib.unpdf_to_json.argtypes = [ctypes.c_void_p, ctypes.c_int]
-_lib.unpdf_to_json.restype = ctypes.c_char_p
+class UnpdfBatchResult(ctypes.Structure):
+    """Mirror of the C ``UnpdfBatchResult`` struct."""
+
+    _fields_ = [
+        ("success", ctypes.c_int),
+        ("data", ctypes.c_void_p),
+        ("error", ctypes.c_void_p),
+    ]
+
+
+# Function signatures: symbol -> (argtypes, restype).
+# Owned strings are returned as c_void_p so they can be released with
+# unpdf_free_string after decoding; only borrowed strings use c_char_p.
+_SIGNATURES = {
+    "unpdf_version": ([], ctypes.c_char_p),
+    "unpdf_last_error": ([], ctypes.c_char_p),
+    "unpdf_parse_file": ([ctypes.c_char_p], ctypes.c_void_p),
+    "unpdf_parse_bytes": ([ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t], ctypes.c_void_p),
+    "unpdf_probe": ([ctypes.c_char_p], ctypes.c_int),
+    "unpdf_free_document": ([ctypes.c_void_p], None),
+    "unpdf_to_markdown": ([ctypes.c_void_p, ctypes.c_int], ctypes.c_void_p),
+    "unpdf_to_markdown_buf": (
+        [ctypes.c_void_p, ctypes.c_uint32, ctypes.POINTER(ctypes.c_size_t)],
+        ctypes.c_void_p,
+    ),
+    "unpdf_to_text": ([ctypes.c_void_p], ctypes.c_void_p),
+    "unpdf_to_text_buf": ([ctypes.c_void_p, ctypes.POINTER(ctypes.c_size_t)], ctypes.c_void_p),
+    "unpdf_to_json": ([ctypes.c_void_p, ctypes.c_int], ctypes.c_void_p),
+    "unpdf_to_json_buf": (
+        [ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(ctypes.c_size_t)],
+        ctypes.c_void_p,
+    ),
+    "unpdf_plain_text": ([ctypes.c_void_p], ctypes.c_void_p),
+    "unpdf_section_count": ([ctypes.c_void_p], ctypes.c_int),
+    "unpdf_resource_count": ([ctypes.c_void_p], ctypes.c_int),
+    "unpdf_get_title": ([ctypes.c_void_p], ctypes.c_void_p),
+    "unpdf_get_author": ([ctypes.c_void_p], ctypes.c_void_p),
+    "unpdf_metadata_keys": ([], ctypes.POINTER(ctypes.c_char_p)),
+    "unpdf_get_metadata": ([ctypes.c_void_p, ctypes.c_char_p], ctypes.c_void_p),
+    "unpdf_free_string": ([ctypes.c_void_p], None),
+    "unpdf_free_many": ([ctypes.POINTER(ctypes.c_void_p), ctypes.c_size_t], None),
+    "unpdf_get_extraction_quality": ([ctypes.c_void_p], ctypes.c_void_p),
+    "unpdf_page_stats": ([ctypes.c_void_p, ctypes.c_int], ctypes.c_void_p),
+    "unpdf_get_resource_ids": ([ctypes.c_void_p], ctypes.c_void_p),
+    "unpdf_get_resource_info": ([ctypes.c_void_p, ctypes.c_char_p], ctypes.c_void_p),
+    "unpdf_get_resource_data": (
+        [ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_size_t)],
+        ctypes.POINTER(ctypes.c_uint8),
+    ),
+    "unpdf_free_bytes": ([ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t], None),
+    "unpdf_batch_extract": (
+        [ctypes.POINTER(ctypes.c_char_p), ctypes.c_size_t, ctypes.c_int, ctypes.c_uint32],
+        ctypes.POINTER(UnpdfBatchResult),
+    ),
+    "unpdf_free_batch_result": ([ctypes.POINTER(UnpdfBatchResult), ctypes.c_size_t], None),
+}
 
-_lib.unpdf_plain_text.argtypes = [ctypes.c_void_p]
-_lib.unpdf_plain_text.restype = ctypes.c_char_p
+# Module attributes bound to native entry points on first access (see __getattr__).
+_BOUND_SYMBOLS = {
+    "version": "unpdf_version",
+    "last_error": "unpdf_last_error",
+    "parse_file": "unpdf_parse_file",
+    "parse_bytes": "unpdf_parse_bytes",
+    "probe": "unpdf_probe",
+    "free_document": "unpdf_free_document",
+    "to_markdown": "unpdf_to_markdown",
+    "to_markdown_buf": "unpdf_to_markdown_buf",
+    "to_text": "unpdf_to_text",
+    "to_text_buf": "unpdf_to_text_buf",
+    "to_json": "unpdf_to_json",
+    "to_json_buf": "unpdf_to_json_buf",
+    "section_count": "unpdf_section_count",
+    "resource_count": "unpdf_resource_count",
+    "get_title": "unpdf_get_title",
+    "get_author": "unpdf_get_author",
+    "metadata_keys": "unpdf_metadata_keys",
+    "get_metadata": "unpdf_get_metadata",
+    "get_extraction_quality": "unpdf_get_extraction_quality",
+    "page_stats": "unpdf_page_stats",
+    "batch_extract": "unpdf_batch_extract",
+    "free_batch_result": "unpdf_free_batch_result",
+    "free_string": "unpdf_free_string",
+    "free_many": "unpdf_free_many",
+}
 
-_lib.unpdf_section_count.argtypes = [ctypes.c_void_p]
-_lib.unpdf_section_count.restype = ctypes.c_int
+# Export constants
+UNPDF_FLAG_FRONTMATTER = 1
+UNPDF_FLAG_ESCAPE_SPECIAL = 2
+UNPDF_FLAG_PARAGRAPH_SPACING = 4
 
-_lib.unpdf_resource_count.argtypes = [ctypes.c_void_p]
-_lib.unpdf_resource_count.restype = ctypes.c_int
+UNPDF_JSON_PRETTY = 0
+UNPDF_JSON_COMPACT = 1
 
-_lib.unpdf_get_title.argtypes = [ctypes.c_void_p]
-_lib.unpdf_get_title.restype = ctypes.c_char_p
+UNPDF_BATCH_MARKDOWN = 0
+UNPDF_BATCH_TEXT = 1
+UNPDF_BATCH_JSON = 2
 
-_lib.unpdf_get_author.argtypes = [ctypes.c_void_p]
-_lib.unpdf_get_author.restype = ctypes.c_char_p
 
-_lib.unpdf_free_string.argtypes = [ctypes.c_char_p]
-_lib.unpdf_free_string.restype = None
+def _declare_signatures(lib: ctypes.CDLL) -> None:
+    """Set argtypes/restype for every entry point in ``_SIGNATURES``."""
+    for name, (argtypes, restype) in _SIGNATURES.items():
+        fn = getattr(lib, name)
+        fn.argtypes = argtypes
+        fn.restype = restype
 
-_lib.unpdf_get_extraction_quality.argtypes = [ctypes.c_void_p]
-_lib.unpdf_get_extraction_quality.restype = ctypes.c_char_p
 
-_lib.unpdf_page_stats.argtypes = [ctypes.c_void_p, ctypes.c_int]
-_lib.unpdf_page_stats.restype = ctypes.c_char_p
+def _fn_addr(fn) -> int:
+    """Return the raw address of a ctypes function pointer."""
+    return ctypes.cast(fn, ctypes.c_void_p).value
 
-_lib.unpdf_get_resource_ids.argtypes = [ctypes.c_void_p]
-_lib.unpdf_get_resource_ids.restype = ctypes.c_char_p
 
-_lib.unpdf_get_resource_info.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
-_lib.unpdf_get_resource_info.restype = ctypes.c_char_p
+def _bind_accelerator(lib: ctypes.CDLL):
+    """Bind the compiled ``_accel`` module to ``lib``, or return None if unavailable."""
+    try:
+        from . import _accel
+    except ImportError:
+        return None
+    _accel.bind(
+        _fn_addr(lib.unpdf_parse_file),
+        _fn_addr(lib.unpdf_free_document),
+        _fn_addr(lib.unpdf_to_markdown_buf),
+        _fn_addr(lib.unpdf_to_text_buf),
+        _fn_addr(lib.unpdf_to_json_buf),
+        _fn_addr(lib.unpdf_free_string),
+        _fn_addr(lib.unpdf_last_error),
+    )
+    return _accel
+
+
+# Loaded on first use by get_library(), not at import.
+_lib = None
+_accel = None
+_load_lock = threading.Lock()
 
-_lib.unpdf_get_resource_data.argtypes = [
-    ctypes.c_void_p,
-    ctypes.c_char_p,
-    ctypes.POINTER(ctypes.c_size_t),
-]
-_lib.unpdf_get_resource_data.restype = ctypes.POINTER(ctypes.c_uint8)
 
-_lib.unpdf_free_bytes.argtypes = [ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t]
-_lib.unpdf_free_bytes.restype = None
+def get_library():
+    """Get the native library, loading it on first use."""
+    global _lib, _accel
+    if _lib is None:
+        with _load_lock:
+            if _lib is None:
+                lib = _load_library()
+                _declare_signatures(lib)
+                _accel = _bind_accelerator(lib)
+                _lib = lib
+    return _lib
 
-# Export constants
-UNPDF_FLAG_FRONTMATTER = 1
-UNPDF_FLAG_ESCAPE_SPECIAL = 2
-UNPDF_FLAG_PARAGRAPH_SPACING = 4
 
-UNPDF_JSON_PRETTY = 0
-UNPDF_JSON_COMPACT = 1
+def get_accelerator():
+    """Get the bound compiled accelerator, or None when only ctypes is available."""
+    get_library()
+    return _accel
 
 
-def get_library():
-    """Get the loaded native library."""
-    return _lib
+def __getattr__(name: str):
+    # Entry points are resolved once, then cached as plain module globals so
+    # callers skip the per-call ``get_library()`` / ``lib.unpdf_*`` lookups.
+    symbol = _BOUND_SYMBOLS.get(name)
+    if symbol is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    fn = getattr(get_library(), symbol)
+    globals()[name] = fn
+    return fn
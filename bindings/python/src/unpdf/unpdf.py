@@ -3,34 +3,477 @@ High-level Python API for unpdf.
 """
 
 import ctypes
+import functools
 import json
-from typing import Any
-
-from ._native import get_library, UNPDF_JSON_PRETTY, UNPDF_JSON_COMPACT
-
-
-def _encode_path(path: str) -> bytes:
-    """Encode a path string to bytes for FFI."""
-    return path.encode("utf-8")
+import os
+import threading
+from typing import Any, Callable, Optional, Union
+
+from ._native import (
+    batch_extract as _c_batch_extract,
+    free_batch_result as _c_free_batch_result,
+    free_document as _c_free_document,
+    free_many as _c_free_many,
+    free_string as _c_free_string,
+    get_accelerator,
+    get_extraction_quality as _c_get_extraction_quality,
+    get_metadata as _c_get_metadata,
+    last_error as _c_last_error,
+    metadata_keys as _c_metadata_keys,
+    page_stats as _c_page_stats,
+    parse_bytes as _c_parse_bytes,
+    parse_file as _c_parse_file,
+    probe as _c_probe,
+    resource_count as _c_resource_count,
+    section_count as _c_section_count,
+    to_json_buf as _c_to_json_buf,
+    to_markdown_buf as _c_to_markdown_buf,
+    to_text_buf as _c_to_text_buf,
+    version as _c_version,
+    UNPDF_BATCH_JSON,
+    UNPDF_BATCH_MARKDOWN,
+    UNPDF_BATCH_TEXT,
+    UNPDF_JSON_COMPACT,
+    UNPDF_JSON_PRETTY,
+)
+
+# Accelerator entry points, bound once so each call is a single global lookup
+# rather than an attribute chain. None when the extension is not built.
+_accel = get_accelerator()
+_accel_to_markdown = _accel.to_markdown if _accel is not None else None
+_accel_to_text = _accel.to_text if _accel is not None else None
+_accel_to_json = _accel.to_json if _accel is not None else None
+_accel_render = _accel.render if _accel is not None else None
+
+
+# Anything accepted as a file path: str, bytes or os.PathLike.
+StrPath = Union[str, bytes, "os.PathLike[str]"]
+
+# In-memory PDF content: any object supporting the buffer protocol.
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def _encode_path(path: StrPath) -> bytes:
+    """Encode a path to UTF-8 bytes for FFI.
+
+    The native library decodes paths as UTF-8, so paths that are not valid
+    UTF-8 (e.g. undecodable POSIX file names) are rejected here with a clear
+    error instead of failing natively. Valid bytes paths pass through as-is.
+    """
+    path = os.fspath(path)
+    try:
+        if isinstance(path, str):
+            return path.encode("utf-8")
+        path.decode("utf-8")
+        return path
+    except UnicodeError:
+        raise ValueError(f"path is not valid UTF-8: {os.fsdecode(path)!r}") from None
 
 
-def _check_last_error(lib: ctypes.CDLL) -> str:
+def _check_last_error() -> str:
     """Get the last error message from the native library."""
-    err = lib.unpdf_last_error()
+    err = _c_last_error()
     if err:
         return err.decode("utf-8")
     return "Unknown error"
 
 
-def _parse_file(lib: ctypes.CDLL, path: str) -> ctypes.c_void_p:
-    """Parse a file and return the document handle. Raises on failure."""
-    handle = lib.unpdf_parse_file(_encode_path(path))
+def _take_string(ptr: int, length: int = -1) -> str:
+    """Decode an owned native string and release it.
+
+    ``length`` is the byte length reported by the ``*_buf`` entry points;
+    -1 falls back to scanning for the terminating NUL.
+    """
+    try:
+        return ctypes.string_at(ptr, length).decode("utf-8")
+    finally:
+        _c_free_string(ptr)
+
+
+@functools.lru_cache(maxsize=1)
+def _metadata_keys() -> tuple[bytes, ...]:
+    """Metadata keys reported by the native library, read once."""
+    keys = _c_metadata_keys()
+    result = []
+    while keys[len(result)] is not None:
+        result.append(keys[len(result)])
+    return tuple(result)
+
+
+def _parse_file(path: bytes) -> int:
+    """Parse an encoded path and return the document handle. Raises on failure."""
+    handle = _c_parse_file(path)
+    if not handle:
+        raise RuntimeError(f"unpdf error: {_check_last_error()}")
+    return handle
+
+
+def _parse_bytes(data: BytesLike) -> int:
+    """Parse an in-memory PDF and return the document handle. Raises on failure.
+
+    Writable buffers (bytearray, writable memoryview) and ``bytes`` are passed
+    to the native library without copying; other buffers are copied once.
+    """
+    view = memoryview(data)
+    if not view.readonly and view.c_contiguous:
+        view = view.cast("B")
+        size = view.nbytes
+        buf = (ctypes.c_uint8 * size).from_buffer(view)
+    else:
+        # c_char_p points at the bytes object's own storage, no copy. Only
+        # valid when the view covers that object exactly; slices and strided
+        # views are copied into a bytes object of their own.
+        raw = view.obj
+        if not (
+            type(raw) is bytes
+            and view.c_contiguous
+            and view.format == "B"
+            and view.nbytes == len(raw)
+        ):
+            raw = view.tobytes()
+        size = len(raw)
+        buf = ctypes.cast(ctypes.c_char_p(raw), ctypes.POINTER(ctypes.c_uint8))
+    handle = _c_parse_bytes(buf, size)
     if not handle:
-        raise RuntimeError(f"unpdf error: {_check_last_error(lib)}")
+        raise RuntimeError(f"unpdf error: {_check_last_error()}")
     return handle
 
 
-def to_markdown(path: str, flags: int = 0) -> str:
+def _render_markdown(handle: int, flags: int) -> str:
+    """Render a document handle as Markdown. Raises on failure."""
+    if _accel_render is not None:
+        return _accel_render(handle, UNPDF_BATCH_MARKDOWN, flags)
+    length = ctypes.c_size_t()
+    result = _c_to_markdown_buf(handle, flags, length)
+    if not result:
+        raise RuntimeError(f"unpdf error: {_check_last_error()}")
+    return _take_string(result, length.value)
+
+
+def _render_text(handle: int) -> str:
+    """Render a document handle as plain text. Raises on failure."""
+    if _accel_render is not None:
+        return _accel_render(handle, UNPDF_BATCH_TEXT, 0)
+    length = ctypes.c_size_t()
+    result = _c_to_text_buf(handle, length)
+    if not result:
+        raise RuntimeError(f"unpdf error: {_check_last_error()}")
+    return _take_string(result, length.value)
+
+
+def _render_json(handle: int, fmt: int) -> str:
+    """Render a document handle as JSON. Raises on failure."""
+    if _accel_render is not None:
+        return _accel_render(handle, UNPDF_BATCH_JSON, fmt)
+    length = ctypes.c_size_t()
+    result = _c_to_json_buf(handle, fmt, length)
+    if not result:
+        raise RuntimeError(f"unpdf error: {_check_last_error()}")
+    return _take_string(result, length.value)
+
+
+def _info(handle: int) -> dict[str, Any]:
+    """Read the metadata of a document handle. Raises on failure."""
+    # Collect every field first and release them with one native call.
+    # NULL means "not set" unless the native side reported an error
+    # (e.g. a value containing a NUL byte).
+    info: dict[str, Any] = {}
+    keys = _metadata_keys()
+    values = (ctypes.c_void_p * len(keys))()
+    try:
+        for i, key in enumerate(keys):
+            value = _c_get_metadata(handle, key)
+            if not value and _c_last_error():
+                raise RuntimeError(f"unpdf error: {_check_last_error()}")
+            values[i] = value
+        for key, value in zip(keys, values):
+            text = ctypes.string_at(value).decode("utf-8") if value else None
+            info[key.decode("ascii")] = text
+    finally:
+        _c_free_many(values, len(values))
+
+    info["section_count"] = _c_section_count(handle)
+    info["resource_count"] = _c_resource_count(handle)
+    return info
+
+
+def _extraction_quality(handle: int) -> dict[str, Any]:
+    """Read the extraction diagnostics of a document handle. Raises on failure."""
+    result = _c_get_extraction_quality(handle)
+    if not result:
+        raise RuntimeError(f"unpdf error: {_check_last_error()}")
+    return json.loads(_take_string(result))
+
+
+def _page_stats(handle: int, page_number: int) -> dict[str, Any]:
+    """Read the operator statistics of one page. Raises on failure."""
+    result = _c_page_stats(handle, page_number)
+    if not result:
+        raise RuntimeError(f"unpdf error: {_check_last_error()}")
+    return json.loads(_take_string(result))
+
+
+def _run_once(handle: int, func: Callable[..., Any], *args: Any) -> Any:
+    """Call ``func(handle, *args)`` and free the handle.
+
+    For the module-level functions: the handle never leaves the call, so it
+    needs none of :class:`Document`'s bookkeeping.
+    """
+    try:
+        return func(handle, *args)
+    finally:
+        _c_free_document(handle)
+
+
+class Document:
+    """
+    A parsed PDF document.
+
+    Parsing is the expensive step; a ``Document`` parses once and serves any
+    number of extractions from the same native handle. Use it as a context
+    manager, or call :meth:`close` when done.
+
+    A document may be shared between threads. Native calls run without the
+    GIL, so :meth:`close` waits for calls already in progress before it
+    releases the handle; calls made after ``close`` raise ``ValueError``.
+
+    Example:
+        >>> with unpdf.Document("document.pdf") as doc:
+        ...     markdown = doc.to_markdown()
+        ...     info = doc.info()
+    """
+
+    def __init__(self, path: StrPath):
+        """
+        Parse a PDF file.
+
+        Args:
+            path: Path to the PDF file.
+
+        Raises:
+            RuntimeError: If parsing fails.
+            ValueError: If the path is not valid UTF-8.
+        """
+        self._init_state()
+        self._path = _encode_path(path)
+        self._handle = _parse_file(self._path)
+
+    @classmethod
+    def from_bytes(cls, data: BytesLike) -> "Document":
+        """
+        Parse an in-memory PDF, skipping the file system.
+
+        Args:
+            data: PDF content (bytes, bytearray or memoryview).
+
+        Returns:
+            The parsed document.
+
+        Raises:
+            RuntimeError: If parsing fails.
+        """
+        doc = cls.__new__(cls)
+        doc._init_state()
+        doc._path = None
+        doc._handle = _parse_bytes(data)
+        return doc
+
+    def _init_state(self) -> None:
+        self._handle = None
+        # Number of native calls currently using the handle, guarded by _lock.
+        # close() waits for it to drop to zero; the condition it waits on is
+        # only created when a call is actually in progress.
+        self._lock = threading.Lock()
+        self._users = 0
+        self._idle: Optional[threading.Condition] = None
+
+    def __repr__(self) -> str:
+        source = "<bytes>" if self._path is None else repr(self._path.decode("utf-8"))
+        state = " (closed)" if self.closed else ""
+        return f"<{type(self).__name__} {source}{state}>"
+
+    def __enter__(self) -> "Document":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # Unreachable, so no call can be using the handle: free it directly.
+        handle, self._handle = self._handle, None
+        if handle:
+            _c_free_document(handle)
+
+    @property
+    def closed(self) -> bool:
+        """True once the native handle has been released."""
+        return self._handle is None
+
+    def close(self) -> None:
+        """
+        Release the native document handle. Safe to call more than once.
+
+        Blocks until native calls already in progress on other threads finish.
+        """
+        with self._lock:
+            handle, self._handle = self._handle, None
+            if self._users:
+                if self._idle is None:
+                    self._idle = threading.Condition(self._lock)
+                while self._users:
+                    self._idle.wait()
+        if handle:
+            _c_free_document(handle)
+
+    def _acquire(self) -> int:
+        """Return the handle and count a user; pair with :meth:`_release`."""
+        with self._lock:
+            handle = self._handle
+            if handle is None:
+                raise ValueError("operation on closed document")
+            self._users += 1
+            return handle
+
+    def _release(self) -> None:
+        with self._lock:
+            self._users -= 1
+            if not self._users and self._idle is not None:
+                self._idle.notify_all()
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages (sections) in the document."""
+        handle = self._acquire()
+        try:
+            return _c_section_count(handle)
+        finally:
+            self._release()
+
+    def to_markdown(self, flags: int = 0) -> str:
+        """
+        Render the document as Markdown.
+
+        Args:
+            flags: Bitwise OR of UNPDF_FLAG_* constants (optional).
+
+        Returns:
+            The extracted content as Markdown.
+
+        Raises:
+            RuntimeError: If rendering fails.
+        """
+        handle = self._acquire()
+        try:
+            return _render_markdown(handle, flags)
+        finally:
+            self._release()
+
+    def to_text(self) -> str:
+        """
+        Render the document as plain text.
+
+        Returns:
+            The extracted content as plain text.
+
+        Raises:
+            RuntimeError: If rendering fails.
+        """
+        handle = self._acquire()
+        try:
+            return _render_text(handle)
+        finally:
+            self._release()
+
+    def to_json(self, pretty: bool = False) -> str:
+        """
+        Render the document as JSON.
+
+        Args:
+            pretty: If True, format JSON with indentation.
+
+        Returns:
+            The extracted content as JSON string.
+
+        Raises:
+            RuntimeError: If rendering fails.
+        """
+        fmt = UNPDF_JSON_PRETTY if pretty else UNPDF_JSON_COMPACT
+        handle = self._acquire()
+        try:
+            return _render_json(handle, fmt)
+        finally:
+            self._release()
+
+    def info(self) -> dict[str, Any]:
+        """
+        Get document metadata. See :func:`get_info`.
+
+        Returns:
+            Dictionary containing document metadata (title, author, section_count, etc.)
+            Metadata fields that are not set map to ``None``.
+        """
+        handle = self._acquire()
+        try:
+            return _info(handle)
+        finally:
+            self._release()
+
+    def extraction_quality(self) -> dict[str, Any]:
+        """
+        Get extraction quality diagnostics. See :func:`get_extraction_quality`.
+
+        Raises:
+            RuntimeError: If retrieval fails.
+        """
+        handle = self._acquire()
+        try:
+            return _extraction_quality(handle)
+        finally:
+            self._release()
+
+    def page_stats(self, page_number: int) -> dict[str, Any]:
+        """
+        Get content-stream operator statistics for a page. See :func:`get_page_stats`.
+
+        Args:
+            page_number: Page number (1-indexed).
+
+        Raises:
+            RuntimeError: If the page is out of range.
+        """
+        handle = self._acquire()
+        try:
+            return _page_stats(handle, page_number)
+        finally:
+            self._release()
+
+
+def open(path: StrPath) -> Document:
+    """
+    Parse a PDF file once for repeated queries.
+
+    Equivalent to ``Document(path)``. Prefer it over calling several
+    module-level functions on the same file, each of which parses it again.
+
+    Args:
+        path: Path to the PDF file.
+
+    Returns:
+        The parsed :class:`Document`; use it as a context manager.
+
+    Raises:
+        RuntimeError: If parsing fails.
+
+    Example:
+        >>> with unpdf.open("document.pdf") as doc:
+        ...     markdown = doc.to_markdown()
+        ...     text = doc.to_text()
+        ...     info = doc.info()
+    """
+    return Document(path)
+
+
+def to_markdown(path: StrPath, flags: int = 0) -> str:
     """
     Convert a PDF file to Markdown format.
 
@@ -44,18 +487,12 @@ def to_markdown(path: str, flags: int = 0) -> str:
     Raises:
         RuntimeError: If conversion fails.
     """
-    lib = get_library()
-    handle = _parse_file(lib, path)
-    try:
-        result = lib.unpdf_to_markdown(handle, flags)
-        if not result:
-            raise RuntimeError(f"unpdf error: {_check_last_error(lib)}")
-        return result.decode("utf-8")
-    finally:
-        lib.unpdf_free_document(handle)
+    if _accel_to_markdown is not None:
+        return _accel_to_markdown(_encode_path(path), flags)
+    return _run_once(_parse_file(_encode_path(path)), _render_markdown, flags)
 
 
-def to_text(path: str) -> str:
+def to_text(path: StrPath) -> str:
     """
     Convert a PDF file to plain text.
 
@@ -68,18 +505,12 @@ def to_text(path: str) -> str:
     Raises:
         RuntimeError: If conversion fails.
     """
-    lib = get_library()
-    handle = _parse_file(lib, path)
-    try:
-        result = lib.unpdf_to_text(handle)
-        if not result:
-            raise RuntimeError(f"unpdf error: {_check_last_error(lib)}")
-        return result.decode("utf-8")
-    finally:
-        lib.unpdf_free_document(handle)
+    if _accel_to_text is not None:
+        return _accel_to_text(_encode_path(path))
+    return _run_once(_parse_file(_encode_path(path)), _render_text)
 
 
-def to_json(path: str, pretty: bool = False) -> str:
+def to_json(path: StrPath, pretty: bool = False) -> str:
     """
     Convert a PDF file to JSON format.
 
@@ -93,19 +524,163 @@ def to_json(path: str, pretty: bool = False) -> str:
     Raises:
         RuntimeError: If conversion fails.
     """
-    lib = get_library()
-    handle = _parse_file(lib, path)
-    try:
+    if _accel_to_json is not None:
         fmt = UNPDF_JSON_PRETTY if pretty else UNPDF_JSON_COMPACT
-        result = lib.unpdf_to_json(handle, fmt)
-        if not result:
-            raise RuntimeError(f"unpdf error: {_check_last_error(lib)}")
-        return result.decode("utf-8")
+        return _accel_to_json(_encode_path(path), fmt)
+    fmt = UNPDF_JSON_PRETTY if pretty else UNPDF_JSON_COMPACT
+    return _run_once(_parse_file(_encode_path(path)), _render_json, fmt)
+
+
+def to_markdown_bytes(data: BytesLike, flags: int = 0) -> str:
+    """
+    Convert an in-memory PDF to Markdown format.
+
+    Args:
+        data: PDF content (bytes, bytearray or memoryview).
+        flags: Bitwise OR of UNPDF_FLAG_* constants (optional).
+
+    Returns:
+        The extracted content as Markdown.
+
+    Raises:
+        RuntimeError: If conversion fails.
+    """
+    return _run_once(_parse_bytes(data), _render_markdown, flags)
+
+
+def to_text_bytes(data: BytesLike) -> str:
+    """
+    Convert an in-memory PDF to plain text.
+
+    Args:
+        data: PDF content (bytes, bytearray or memoryview).
+
+    Returns:
+        The extracted content as plain text.
+
+    Raises:
+        RuntimeError: If conversion fails.
+    """
+    return _run_once(_parse_bytes(data), _render_text)
+
+
+def to_json_bytes(data: BytesLike, pretty: bool = False) -> str:
+    """
+    Convert an in-memory PDF to JSON format.
+
+    Args:
+        data: PDF content (bytes, bytearray or memoryview).
+        pretty: If True, format JSON with indentation.
+
+    Returns:
+        The extracted content as JSON string.
+
+    Raises:
+        RuntimeError: If conversion fails.
+    """
+    fmt = UNPDF_JSON_PRETTY if pretty else UNPDF_JSON_COMPACT
+    return _run_once(_parse_bytes(data), _render_json, fmt)
+
+
+def _batch_extract(
+    paths: list[StrPath], mode: int, flags: int, return_exceptions: bool
+) -> list[Union[str, RuntimeError]]:
+    """Extract many files with a single native call."""
+    paths = list(paths)
+    if not paths:
+        return []
+
+    count = len(paths)
+    c_paths = (ctypes.c_char_p * count)(*(_encode_path(p) for p in paths))
+    results = _c_batch_extract(c_paths, count, mode, flags)
+    if not results:
+        raise RuntimeError(f"unpdf error: {_check_last_error()}")
+    try:
+        outputs: list[Union[str, RuntimeError]] = []
+        for i, path in enumerate(paths):
+            result = results[i]
+            if result.success:
+                outputs.append(ctypes.string_at(result.data).decode("utf-8"))
+            else:
+                error = ctypes.string_at(result.error).decode("utf-8")
+                outputs.append(RuntimeError(f"unpdf error: {os.fsdecode(path)}: {error}"))
     finally:
-        lib.unpdf_free_document(handle)
+        _c_free_batch_result(results, count)
+
+    if not return_exceptions:
+        for output in outputs:
+            if isinstance(output, RuntimeError):
+                raise output
+    return outputs
+
+
+def to_markdown_batch(
+    paths: list[StrPath], flags: int = 0, return_exceptions: bool = False
+) -> list[Union[str, RuntimeError]]:
+    """
+    Convert many PDF files to Markdown with a single native call.
+
+    Files are parsed in parallel inside the native library, and the whole
+    batch crosses the FFI boundary once instead of once per file.
+
+    Args:
+        paths: Paths to the PDF files.
+        flags: Bitwise OR of UNPDF_FLAG_* constants (optional).
+        return_exceptions: If True, a file that fails yields a RuntimeError in
+            its slot instead of raising.
+
+    Returns:
+        The Markdown of each file, in input order.
+
+    Raises:
+        RuntimeError: If any file fails and ``return_exceptions`` is False.
+    """
+    return _batch_extract(paths, UNPDF_BATCH_MARKDOWN, flags, return_exceptions)
+
 
+def to_text_batch(
+    paths: list[StrPath], return_exceptions: bool = False
+) -> list[Union[str, RuntimeError]]:
+    """
+    Convert many PDF files to plain text with a single native call.
+
+    Args:
+        paths: Paths to the PDF files.
+        return_exceptions: If True, a file that fails yields a RuntimeError in
+            its slot instead of raising.
+
+    Returns:
+        The plain text of each file, in input order.
 
-def get_info(path: str) -> dict[str, Any]:
+    Raises:
+        RuntimeError: If any file fails and ``return_exceptions`` is False.
+    """
+    return _batch_extract(paths, UNPDF_BATCH_TEXT, 0, return_exceptions)
+
+
+def to_json_batch(
+    paths: list[StrPath], pretty: bool = False, return_exceptions: bool = False
+) -> list[Union[str, RuntimeError]]:
+    """
+    Convert many PDF files to JSON with a single native call.
+
+    Args:
+        paths: Paths to the PDF files.
+        pretty: If True, format JSON with indentation.
+        return_exceptions: If True, a file that fails yields a RuntimeError in
+            its slot instead of raising.
+
+    Returns:
+        The JSON string of each file, in input order.
+
+    Raises:
+        RuntimeError: If any file fails and ``return_exceptions`` is False.
+    """
+    fmt = UNPDF_JSON_PRETTY if pretty else UNPDF_JSON_COMPACT
+    return _batch_extract(paths, UNPDF_BATCH_JSON, fmt, return_exceptions)
+
+
+def get_info(path: StrPath) -> dict[str, Any]:
     """
     Get document metadata from a PDF file.
 
@@ -126,28 +701,10 @@ def get_info(path: str) -> dict[str, Any]:
     Raises:
         RuntimeError: If extraction fails.
     """
-    lib = get_library()
-    handle = _parse_file(lib, path)
-    try:
-        info: dict[str, Any] = {}
-
-        title = lib.unpdf_get_title(handle)
-        if title:
-            info["title"] = title.decode("utf-8")
+    return _run_once(_parse_file(_encode_path(path)), _info)
 
-        author = lib.unpdf_get_author(handle)
-        if author:
-            info["author"] = author.decode("utf-8")
 
-        info["section_count"] = lib.unpdf_section_count(handle)
-        info["resource_count"] = lib.unpdf_resource_count(handle)
-
-        return info
-    finally:
-        lib.unpdf_free_document(handle)
-
-
-def get_extraction_quality(path: str) -> dict[str, Any]:
+def get_extraction_quality(path: StrPath) -> dict[str, Any]:
     """
     Get extraction quality diagnostics for a PDF file.
 
@@ -165,18 +722,10 @@ def get_extraction_quality(path: str) -> dict[str, Any]:
     Raises:
         RuntimeError: If parsing or retrieval fails.
     """
-    lib = get_library()
-    handle = _parse_file(lib, path)
-    try:
-        result = lib.unpdf_get_extraction_quality(handle)
-        if not result:
-            raise RuntimeError(f"unpdf error: {_check_last_error(lib)}")
-        return json.loads(result.decode("utf-8"))
-    finally:
-        lib.unpdf_free_document(handle)
+    return _run_once(_parse_file(_encode_path(path)), _extraction_quality)
 
 
-def get_page_stats(path: str, page_number: int) -> dict[str, Any]:
+def get_page_stats(path: StrPath, page_number: int) -> dict[str, Any]:
     """
     Get content-stream operator statistics for a single page.
 
@@ -194,18 +743,10 @@ def get_page_stats(path: str, page_number: int) -> dict[str, Any]:
     Raises:
         RuntimeError: If parsing fails or the page is out of range.
     """
-    lib = get_library()
-    handle = _parse_file(lib, path)
-    try:
-        result = lib.unpdf_page_stats(handle, page_number)
-        if not result:
-            raise RuntimeError(f"unpdf error: {_check_last_error(lib)}")
-        return json.loads(result.decode("utf-8"))
-    finally:
-        lib.unpdf_free_document(handle)
+    return _run_once(_parse_file(_encode_path(path)), _page_stats, page_number)
 
 
-def get_page_count(path: str) -> int:
+def get_page_count(path: StrPath) -> int:
     """
     Get the number of pages (sections) in a PDF file.
 
@@ -215,31 +756,32 @@ def get_page_count(path: str) -> int:
     Returns:
         The number of pages, or -1 on error.
     """
-    lib = get_library()
-    handle = lib.unpdf_parse_file(_encode_path(path))
-    if not handle:
-        return -1
     try:
-        return lib.unpdf_section_count(handle)
-    finally:
-        lib.unpdf_free_document(handle)
+        return _run_once(_parse_file(_encode_path(path)), _c_section_count)
+    except RuntimeError:
+        return -1
 
 
-def is_pdf(path: str) -> bool:
+def is_pdf(path: StrPath, strict: bool = False) -> bool:
     """
-    Check if a file is a valid PDF by attempting to parse it.
+    Check if a file is a PDF.
+
+    By default only the ``%PDF-X.Y`` header is read, so the check costs the
+    same for any file size — suitable for scanning large directories.
 
     Args:
         path: Path to the file.
+        strict: Fully parse the file instead of checking the header.
 
     Returns:
-        True if the file can be parsed as a PDF, False otherwise.
+        True if the file is a PDF (can be parsed, when ``strict``), False otherwise.
     """
-    lib = get_library()
-    handle = lib.unpdf_parse_file(_encode_path(path))
-    if not handle:
+    if not strict:
+        return bool(_c_probe(_encode_path(path)))
+    try:
+        _c_free_document(_parse_file(_encode_path(path)))
+    except RuntimeError:
         return False
-    lib.unpdf_free_document(handle)
     return True
 
 
@@ -250,8 +792,7 @@ def version() -> str:
     Returns:
         Version string.
     """
-    lib = get_library()
-    ver = lib.unpdf_version()
+    ver = _c_version()
     if ver:
         return ver.decode("utf-8")
     return "unknown"
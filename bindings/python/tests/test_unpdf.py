@@ -3,11 +3,113 @@ Tests for unpdf Python bindings.
 """
 
 import os
+import subprocess
+import sys
+
 import pytest
 
 import unpdf
 
 
+class TestImport:
+    """Tests for import-time behaviour."""
+
+    def test_import_does_not_load_library(self):
+        """``import unpdf`` defers loading the native library to first use."""
+        code = (
+            "import unpdf, unpdf._native as n\n"
+            "assert n._lib is None\n"
+            "unpdf.version()\n"
+            "assert n._lib is not None\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestPlatformDetection:
+    """Tests for native library platform detection."""
+
+    def test_os_release_ids(self, tmp_path):
+        """ID and ID_LIKE are parsed, quoted or not."""
+        from unpdf import _native
+
+        os_release = tmp_path / "os-release"
+        os_release.write_text('NAME="Ubuntu"\nID=ubuntu\nID_LIKE="debian"\n')
+        assert _native._os_release_ids(str(os_release)) == {"ubuntu", "debian"}
+
+    def test_os_release_missing(self, tmp_path):
+        """A missing os-release yields no IDs."""
+        from unpdf import _native
+
+        assert _native._os_release_ids(str(tmp_path / "missing")) == set()
+
+    def test_baked_lib_path(self, monkeypatch):
+        """A build-time _lib_path module short-circuits platform detection."""
+        import types
+
+        from unpdf import _native
+
+        baked = types.ModuleType("unpdf._lib_path")
+        baked.LIB_RELATIVE = "lib/linux-x64/libunpdf.so"
+        monkeypatch.setitem(sys.modules, "unpdf._lib_path", baked)
+        monkeypatch.delenv("UNPDF_LIB_PATH", raising=False)
+        monkeypatch.setattr(_native.platform, "system", lambda: "Plan9")
+
+        expected = os.path.join(os.path.dirname(_native.__file__), baked.LIB_RELATIVE)
+        assert str(_native._get_lib_path()) == expected
+
+    def test_is_musl_from_multiarch(self, monkeypatch):
+        """A musl target triplet decides without reading any file."""
+        from unpdf import _native
+
+        monkeypatch.setattr(sys.implementation, "_multiarch", "x86_64-linux-musl", raising=False)
+        monkeypatch.setattr(_native, "_elf_interpreter", lambda: pytest.fail("I/O"))
+        _native._is_musl.cache_clear()
+        try:
+            assert _native._is_musl() is True
+        finally:
+            _native._is_musl.cache_clear()
+
+    @pytest.mark.parametrize(
+        "interp, expected",
+        [("/lib/ld-musl-x86_64.so.1", True), ("/lib64/ld-linux-x86-64.so.2", False)],
+    )
+    def test_is_musl_gnu_multiarch_checks_interpreter(self, monkeypatch, interp, expected):
+        """A gnu triplet is not trusted: CPython < 3.13 reports it on musl too."""
+        from unpdf import _native
+
+        monkeypatch.setattr(sys.implementation, "_multiarch", "x86_64-linux-gnu", raising=False)
+        monkeypatch.setattr(_native, "_elf_interpreter", lambda: interp)
+        _native._is_musl.cache_clear()
+        try:
+            assert _native._is_musl() is expected
+        finally:
+            _native._is_musl.cache_clear()
+
+    def test_elf_interpreter(self, tmp_path):
+        """PT_INTERP is read from a 64-bit little-endian ELF header."""
+        import struct
+
+        from unpdf import _native
+
+        interp = b"/lib/ld-musl-x86_64.so.1\0"
+        header = bytearray(64)
+        header[:6] = b"\x7fELF\x02\x01"
+        struct.pack_into("<Q", header, 0x20, 64)  # e_phoff
+        struct.pack_into("<HH", header, 0x36, 56, 1)  # e_phentsize, e_phnum
+        phdr = struct.pack("<IIQQQQQQ", 3, 4, 64 + 56, 0, 0, len(interp), len(interp), 1)
+        elf = tmp_path / "python"
+        elf.write_bytes(bytes(header) + phdr + interp)
+        assert _native._elf_interpreter(str(elf)) == "/lib/ld-musl-x86_64.so.1"
+
+    def test_elf_interpreter_not_elf(self, tmp_path):
+        """Non-ELF files have no interpreter."""
+        from unpdf import _native
+
+        script = tmp_path / "python"
+        script.write_text("#!/bin/sh\n")
+        assert _native._elf_interpreter(str(script)) is None
+
+
 class TestVersion:
     """Tests for version function."""
 
@@ -31,6 +133,20 @@ class TestIsPdf:
         txt_file.write_text("This is not a PDF")
         assert unpdf.is_pdf(str(txt_file)) is False
 
+    def test_header_only_unless_strict(self, tmp_path):
+        """The default check reads the header; strict=True parses the file."""
+        truncated = tmp_path / "truncated.pdf"
+        truncated.write_bytes(b"%PDF-1.7\n")
+        assert unpdf.is_pdf(truncated) is True
+
+        txt_file = tmp_path / "test.txt"
+        txt_file.write_text("This is not a PDF")
+        assert unpdf.is_pdf(txt_file, strict=True) is False
+
+        pdf_file = tmp_path / "text.pdf"
+        pdf_file.write_bytes(_text_pdf())
+        assert unpdf.is_pdf(pdf_file, strict=True) is True
+
 
 class TestGetPageCount:
     """Tests for get_page_count function."""
@@ -165,6 +281,155 @@ class TestGetPageStats:
             unpdf.get_page_stats(str(pdf_file), 99)
 
 
+class TestDocument:
+    """Tests for the Document class."""
+
+    def test_non_existent_file_raises(self):
+        """Non-existent file should raise RuntimeError."""
+        with pytest.raises(RuntimeError):
+            unpdf.Document("non_existent_file.pdf")
+
+    def test_matches_module_functions(self, tmp_path):
+        """One parse serves every extraction with the same results."""
+        pdf_file = tmp_path / "text.pdf"
+        pdf_file.write_bytes(_text_pdf())
+        path = str(pdf_file)
+        with unpdf.Document(path) as doc:
+            assert doc.to_markdown() == unpdf.to_markdown(path)
+            assert doc.to_text() == unpdf.to_text(path)
+            assert doc.to_json(pretty=True) == unpdf.to_json(path, pretty=True)
+            assert doc.info() == unpdf.get_info(path)
+            assert doc.page_count == unpdf.get_page_count(path)
+
+    def test_open(self, tmp_path):
+        """unpdf.open parses once and returns a Document."""
+        pdf_file = tmp_path / "text.pdf"
+        pdf_file.write_bytes(_text_pdf())
+        with unpdf.open(pdf_file) as doc:
+            assert isinstance(doc, unpdf.Document)
+            assert doc.to_text() == unpdf.to_text(pdf_file)
+        assert doc.closed
+
+    def test_star_import_keeps_builtin_open(self):
+        """``from unpdf import *`` does not shadow the builtin open()."""
+        import builtins
+
+        namespace = {}
+        exec("from unpdf import *", namespace)
+        assert "open" not in namespace
+        assert "Document" in namespace
+        assert unpdf.open is not builtins.open
+
+    def test_accepts_path_like_and_bytes(self, tmp_path):
+        """pathlib.Path and bytes paths work like str paths."""
+        pdf_file = tmp_path / "text.pdf"
+        pdf_file.write_bytes(_text_pdf())
+        expected = unpdf.to_text(str(pdf_file))
+        assert unpdf.to_text(pdf_file) == expected
+        assert unpdf.to_text(os.fsencode(pdf_file)) == expected
+        with unpdf.Document(pdf_file) as doc:
+            assert doc.to_text() == expected
+
+    @pytest.mark.parametrize("path", [b"bad-\xff.pdf", "bad-\udcff.pdf"])
+    def test_non_utf8_path_raises(self, path):
+        """Paths the native library cannot decode are rejected with ValueError."""
+        with pytest.raises(ValueError, match="not valid UTF-8"):
+            unpdf.Document(path)
+        with pytest.raises(ValueError, match="not valid UTF-8"):
+            unpdf.to_text_batch([path])
+
+    def test_closed_document_raises(self, tmp_path):
+        """Using a closed document raises ValueError; close is idempotent."""
+        pdf_file = tmp_path / "text.pdf"
+        pdf_file.write_bytes(_text_pdf())
+        with unpdf.Document(str(pdf_file)) as doc:
+            pass
+        assert doc.closed
+        doc.close()
+        with pytest.raises(ValueError):
+            doc.to_text()
+
+    def test_close_waits_for_running_call(self, tmp_path, monkeypatch):
+        """close() from another thread does not free the handle mid-render."""
+        import threading
+
+        from unpdf import unpdf as api
+
+        started, release = threading.Event(), threading.Event()
+        freed = []
+
+        def slow_render(handle, mode, arg):
+            started.set()
+            release.wait(5)
+            assert not freed, "handle freed while in use"
+            return "rendered"
+
+        real_free = api._c_free_document
+        monkeypatch.setattr(api, "_accel_render", slow_render)
+        monkeypatch.setattr(
+            api, "_c_free_document", lambda h: (freed.append(h), real_free(h))
+        )
+
+        pdf_file = tmp_path / "text.pdf"
+        pdf_file.write_bytes(_text_pdf())
+        doc = unpdf.Document(pdf_file)
+        results = []
+        render = threading.Thread(target=lambda: results.append(doc.to_text()))
+        render.start()
+        assert started.wait(5)
+
+        closer = threading.Thread(target=doc.close)
+        closer.start()
+        closer.join(0.2)
+        assert closer.is_alive()  # waiting for the render
+        assert doc.closed  # but new calls are already refused
+        with pytest.raises(ValueError):
+            doc.to_markdown()
+
+        release.set()
+        render.join(5)
+        closer.join(5)
+        assert results == ["rendered"]
+        assert len(freed) == 1
+
+
+class TestBytes:
+    """Tests for the in-memory (bytes) conversion functions."""
+
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+    def test_matches_file_conversion(self, tmp_path, wrap):
+        """bytes, bytearray and memoryview inputs match the file-based result."""
+        pdf_file = tmp_path / "text.pdf"
+        pdf_file.write_bytes(_text_pdf())
+        data = wrap(_text_pdf())
+        assert unpdf.to_markdown_bytes(data) == unpdf.to_markdown(str(pdf_file))
+        assert unpdf.to_text_bytes(data) == unpdf.to_text(str(pdf_file))
+        assert unpdf.to_json_bytes(data) == unpdf.to_json(str(pdf_file))
+
+    def test_sliced_memoryview(self):
+        """A memoryview slice parses its own bytes, not the whole buffer."""
+        data = memoryview(b"JUNKJUNK" + _text_pdf())[8:]
+        assert unpdf.to_text_bytes(data) == unpdf.to_text_bytes(_text_pdf())
+
+    def test_strided_memoryview(self):
+        """A non-contiguous memoryview is copied before parsing."""
+        interleaved = bytes(b for c in _text_pdf() for b in (c, 0))
+        data = memoryview(interleaved)[::2]
+        assert not data.c_contiguous
+        assert unpdf.to_text_bytes(data) == unpdf.to_text_bytes(_text_pdf())
+
+    def test_document_from_bytes(self):
+        """Document.from_bytes parses once for repeated queries."""
+        with unpdf.Document.from_bytes(_text_pdf()) as doc:
+            assert doc.page_count == 1
+            assert doc.to_text() == unpdf.to_text_bytes(_text_pdf())
+
+    def test_invalid_data_raises(self):
+        """Non-PDF data should raise RuntimeError."""
+        with pytest.raises(RuntimeError):
+            unpdf.to_text_bytes(b"This is not a PDF")
+
+
 class TestToJson:
     """Tests for to_json function."""
 
@@ -181,3 +446,143 @@ class TestGetInfo:
         """Non-existent file should raise RuntimeError."""
         with pytest.raises(RuntimeError):
             unpdf.get_info("non_existent_file.pdf")
+
+    def test_metadata_keys_always_present(self, tmp_path):
+        """Every metadata field is reported; unset fields map to None."""
+        pdf_file = tmp_path / "text.pdf"
+        pdf_file.write_bytes(_text_pdf())
+        info = unpdf.get_info(str(pdf_file))
+        for key in ("title", "author", "subject", "producer", "created", "pdf_version"):
+            assert key in info
+        assert info["section_count"] == 1
+
+    def test_metadata_error_raises(self, tmp_path, monkeypatch):
+        """A field the native side cannot return (NUL byte) raises, unlike an unset one."""
+        from unpdf import unpdf as api
+
+        real_get_metadata = api._c_get_metadata
+        error = []
+
+        def get_metadata(handle, key):
+            error.clear()
+            if key == b"author":
+                error.append(b"metadata author contains null byte")
+                return None
+            return real_get_metadata(handle, key)
+
+        monkeypatch.setattr(api, "_c_get_metadata", get_metadata)
+        monkeypatch.setattr(api, "_c_last_error", lambda: error[0] if error else None)
+
+        pdf_file = tmp_path / "text.pdf"
+        pdf_file.write_bytes(_text_pdf())
+        with pytest.raises(RuntimeError, match="null byte"):
+            unpdf.get_info(pdf_file)
+
+
+class TestAccelerator:
+    """The compiled fast path must match the ctypes fallback."""
+
+    @pytest.fixture(autouse=True)
+    def _require_accelerator(self):
+        from unpdf import _native
+
+        if _native.get_accelerator() is None:
+            pytest.skip("unpdf._accel is not built")
+
+    def _without_accelerator(self, monkeypatch):
+        from unpdf import unpdf as api
+
+        for name in ("_accel_to_markdown", "_accel_to_text", "_accel_to_json", "_accel_render"):
+            monkeypatch.setattr(api, name, None)
+
+    def test_outputs_match_ctypes_path(self, tmp_path, monkeypatch):
+        """Markdown, text and JSON are identical with and without the accelerator."""
+        pdf_file = tmp_path / "text.pdf"
+        pdf_file.write_bytes(_text_pdf())
+        path = str(pdf_file)
+        fast = (unpdf.to_markdown(path), unpdf.to_text(path), unpdf.to_json(path))
+        self._without_accelerator(monkeypatch)
+        slow = (unpdf.to_markdown(path), unpdf.to_text(path), unpdf.to_json(path))
+        assert fast == slow
+
+    def test_document_matches_ctypes_path(self, tmp_path, monkeypatch):
+        """Document rendering is identical with and without the accelerator."""
+        pdf_file = tmp_path / "text.pdf"
+        pdf_file.write_bytes(_text_pdf())
+
+        def render():
+            with unpdf.Document(pdf_file) as doc:
+                return (doc.to_markdown(1), doc.to_text(), doc.to_json(pretty=True))
+
+        fast = render()
+        self._without_accelerator(monkeypatch)
+        assert render() == fast
+
+    def test_non_existent_file_raises(self):
+        """Errors surface as RuntimeError, like the ctypes path."""
+        with pytest.raises(RuntimeError):
+            unpdf.to_markdown("non_existent_file.pdf")
+
+
+class TestThreads:
+    """The bindings are safe to call from several threads at once."""
+
+    def test_concurrent_conversions(self, tmp_path):
+        """Concurrent calls return the same results as sequential ones."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        pdf_file = tmp_path / "text.pdf"
+        pdf_file.write_bytes(_text_pdf())
+        paths = [str(pdf_file), "non_existent_file.pdf"] * 8
+
+        def convert(path):
+            try:
+                return unpdf.to_text(path)
+            except RuntimeError:
+                return None
+
+        expected = [convert(p) for p in paths]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            assert list(pool.map(convert, paths)) == expected
+
+
+class TestBatch:
+    """Tests for the batch conversion functions."""
+
+    def test_empty_batch(self):
+        """An empty batch returns an empty list without a native call."""
+        assert unpdf.to_markdown_batch([]) == []
+
+    def test_results_in_input_order(self, tmp_path):
+        """Each path maps to the same output as the single-file function."""
+        paths = []
+        for name in ("a.pdf", "b.pdf"):
+            pdf_file = tmp_path / name
+            pdf_file.write_bytes(_text_pdf())
+            paths.append(str(pdf_file))
+        assert unpdf.to_markdown_batch(paths) == [unpdf.to_markdown(p) for p in paths]
+        assert unpdf.to_text_batch(paths) == [unpdf.to_text(p) for p in paths]
+        assert unpdf.to_json_batch(paths) == [unpdf.to_json(p) for p in paths]
+
+    def test_failure_raises(self, tmp_path):
+        """A failing file raises RuntimeError by default."""
+        pdf_file = tmp_path / "text.pdf"
+        pdf_file.write_bytes(_text_pdf())
+        with pytest.raises(RuntimeError):
+            unpdf.to_markdown_batch([str(pdf_file), "non_existent_file.pdf"])
+
+    def test_return_exceptions(self, tmp_path):
+        """With return_exceptions, failures are reported in place."""
+        pdf_file = tmp_path / "text.pdf"
+        pdf_file.write_bytes(_text_pdf())
+        results = unpdf.to_text_batch(
+            [str(pdf_file), "non_existent_file.pdf"], return_exceptions=True
+        )
+        assert isinstance(results[0], str)
+        assert isinstance(results[1], RuntimeError)
+
+    def test_error_shows_str_path(self):
+        """Batch errors name the file as text, even for bytes paths."""
+        results = unpdf.to_text_batch([b"non_existent_file.pdf"], return_exceptions=True)
+        assert "non_existent_file.pdf:" in str(results[0])
+        assert "b'" not in str(results[0])
@@ -8,9 +8,12 @@
  *
  * Memory rules:
  *  - Every char* returned by a function documented as "must be freed" is
- *    owned by the caller and released with unpdf_free_string().
+ *    owned by the caller and released with unpdf_free_string(), or in bulk
+ *    with unpdf_free_many().
  *  - Byte buffers from unpdf_get_resource_data() are released with
  *    unpdf_free_bytes().
+ *  - Result arrays from unpdf_batch_extract() are released, together with
+ *    every string they hold, by unpdf_free_batch_result().
  *  - Document handles are released with unpdf_free_document().
  *  - unpdf_version() / unpdf_last_error() return borrowed pointers —
  *    do not free them.
@@ -38,6 +41,21 @@ typedef struct UnpdfDocument UnpdfDocument;
 #define UNPDF_JSON_PRETTY  0
 #define UNPDF_JSON_COMPACT 1
 
+/* Output selector for unpdf_batch_extract. */
+#define UNPDF_BATCH_MARKDOWN 0
+#define UNPDF_BATCH_TEXT     1
+#define UNPDF_BATCH_JSON     2
+
+/**
+ * Per-file outcome of unpdf_batch_extract. Exactly one of `data` / `error`
+ * is non-NULL; both are owned by the result array.
+ */
+typedef struct UnpdfBatchResult {
+    int success;  /* 1 if the file was extracted, 0 otherwise. */
+    char* data;   /* Extracted content, or NULL on failure. */
+    char* error;  /* Error message, or NULL on success. */
+} UnpdfBatchResult;
+
 /**
  * Get the library version.
  * @return Statically allocated version string — do not free.
@@ -68,6 +86,16 @@ UnpdfDocument* unpdf_parse_file(const char* path);
  */
 UnpdfDocument* unpdf_parse_bytes(const uint8_t* data, size_t len);
 
+/**
+ * Check whether a file looks like a PDF by reading only its %PDF-X.Y header.
+ *
+ * Cost is independent of the file size. A file that passes may still fail to
+ * parse; use unpdf_parse_file for a full check.
+ *
+ * @return 1 if the header is valid, 0 otherwise (including unreadable files).
+ */
+int unpdf_probe(const char* path);
+
 /** Free a document handle. Safe to call with NULL. */
 void unpdf_free_document(UnpdfDocument* doc);
 
@@ -78,9 +106,23 @@ void unpdf_free_document(UnpdfDocument* doc);
  */
 char* unpdf_to_markdown(const UnpdfDocument* doc, uint32_t flags);
 
+/**
+ * Same as unpdf_to_markdown, but also writes the byte length of the result
+ * (excluding the terminating NUL) to `out_len`, so callers can decode it
+ * without a strlen scan. `out_len` is set to 0 on error.
+ * @return Markdown string (must be freed with unpdf_free_string), or NULL.
+ */
+char* unpdf_to_markdown_buf(const UnpdfDocument* doc, uint32_t flags, size_t* out_len);
+
 /** Convert the document to plain text. Free with unpdf_free_string. */
 char* unpdf_to_text(const UnpdfDocument* doc);
 
+/**
+ * Same as unpdf_to_text, but also writes the byte length of the result to
+ * `out_len` (0 on error). Free with unpdf_free_string.
+ */
+char* unpdf_to_text_buf(const UnpdfDocument* doc, size_t* out_len);
+
 /**
  * Convert the document to JSON.
  * @param format UNPDF_JSON_PRETTY or UNPDF_JSON_COMPACT.
@@ -88,6 +130,12 @@ char* unpdf_to_text(const UnpdfDocument* doc);
  */
 char* unpdf_to_json(const UnpdfDocument* doc, int format);
 
+/**
+ * Same as unpdf_to_json, but also writes the byte length of the result to
+ * `out_len` (0 on error). Free with unpdf_free_string.
+ */
+char* unpdf_to_json_buf(const UnpdfDocument* doc, int format, size_t* out_len);
+
 /** Get the plain text content. Free with unpdf_free_string. */
 char* unpdf_plain_text(const UnpdfDocument* doc);
 
@@ -111,6 +159,29 @@ char* unpdf_get_title(const UnpdfDocument* doc);
 /** Document author, or NULL if absent. Free with unpdf_free_string. */
 char* unpdf_get_author(const UnpdfDocument* doc);
 
+/**
+ * Metadata keys understood by unpdf_get_metadata.
+ *
+ * Lets bindings enumerate the metadata fields instead of hard-coding them:
+ * title, author, subject, keywords, creator, producer, created, modified,
+ * pdf_version.
+ *
+ * @return Static NULL-terminated array of static strings. Do NOT free.
+ */
+const char* const* unpdf_metadata_keys(void);
+
+/**
+ * A single metadata field by key (see unpdf_metadata_keys).
+ *
+ * Dates (created, modified) are formatted as RFC 3339.
+ *
+ * @return Field value (must be freed with unpdf_free_string), or NULL if the
+ *         field is not set (no error is set). An unknown key, or a value
+ *         containing a NUL byte, also returns NULL and sets the error message
+ *         (see unpdf_last_error).
+ */
+char* unpdf_get_metadata(const UnpdfDocument* doc, const char* key);
+
 /**
  * Extraction quality diagnostics as a JSON object.
  *
@@ -182,9 +253,33 @@ char* unpdf_page_to_markdown(const UnpdfDocument* doc, int page_num, uint32_t fl
  */
 char* unpdf_page_to_text(const UnpdfDocument* doc, int page_num);
 
+/**
+ * Parse and render many files in one call, in parallel.
+ * A failure on one file is reported in its own result entry and does not
+ * affect the others.
+ * @param paths UTF-8, null-terminated paths.
+ * @param count Number of entries in `paths`.
+ * @param mode  One of UNPDF_BATCH_*.
+ * @param flags UNPDF_FLAG_* bits for UNPDF_BATCH_MARKDOWN, an UNPDF_JSON_*
+ *              value for UNPDF_BATCH_JSON, ignored for UNPDF_BATCH_TEXT.
+ * @return Array of `count` results in input order (must be freed with
+ *         unpdf_free_batch_result), or NULL on error (see unpdf_last_error).
+ */
+UnpdfBatchResult* unpdf_batch_extract(const char* const* paths, size_t count,
+                                      int mode, uint32_t flags);
+
+/** Free a result array and its strings. Safe to call with NULL. */
+void unpdf_free_batch_result(UnpdfBatchResult* results, size_t count);
+
 /** Free a string allocated by the library. Safe to call with NULL. */
 void unpdf_free_string(char* s);
 
+/**
+ * Free `count` library-allocated strings in one call. NULL entries are
+ * skipped; the array itself stays owned by the caller.
+ */
+void unpdf_free_many(char* const* ptrs, size_t count);
+
 /** Free a byte buffer allocated by the library. */
 void unpdf_free_bytes(uint8_t* data, size_t len);
 
@@ -4,7 +4,7 @@ use crate::error::{Error, Result};
 #[cfg(not(target_arch = "wasm32"))]
 use std::fs::File;
 #[cfg(not(target_arch = "wasm32"))]
-use std::io::{BufReader, Read};
+use std::io::Read;
 #[cfg(not(target_arch = "wasm32"))]
 use std::path::Path;
 
@@ -46,10 +46,10 @@ const VERSION_LEN: usize = 3; // e.g., "1.7"
 /// ```
 #[cfg(not(target_arch = "wasm32"))]
 pub fn detect_format_from_path<P: AsRef<Path>>(path: P) -> Result<PdfFormat> {
-    let file = File::open(path)?;
-    let mut reader = BufReader::new(file);
-    let mut header = [0u8; 16];
-    reader.read_exact(&mut header)?;
+    // Only the magic and version are inspected, so read exactly those bytes
+    // (no buffered reader: a probe should cost one open and one small read).
+    let mut header = [0u8; PDF_MAGIC_LEN + VERSION_LEN];
+    File::open(path)?.read_exact(&mut header)?;
     detect_format_from_bytes(&header)
 }
 
@@ -155,6 +155,35 @@ mod tests {
         assert!(matches!(result, Err(Error::UnknownFormat)));
     }
 
+    #[cfg(not(target_arch = "wasm32"))]
+    #[test]
+    fn test_detect_from_path_short_files() {
+        let dir = tempfile::tempdir().unwrap();
+        let write = |name: &str, data: &[u8]| {
+            let path = dir.path().join(name);
+            std::fs::write(&path, data).unwrap();
+            path
+        };
+
+        // Shorter than the 8-byte `%PDF-X.Y` header: not a PDF
+        let short = write("short.pdf", b"%PDF-1.");
+        assert!(detect_format_from_path(&short).is_err());
+        assert!(!is_pdf(&short));
+
+        // Exactly the header, and between 8 and 16 bytes: only the header is read
+        let header_only = write("header.pdf", b"%PDF-1.7");
+        assert_eq!(
+            detect_format_from_path(&header_only).unwrap().version,
+            "1.7"
+        );
+        let truncated = write("truncated.pdf", b"%PDF-1.4\n%\xe2\xe3");
+        assert_eq!(detect_format_from_path(&truncated).unwrap().version, "1.4");
+        assert!(is_pdf(&truncated));
+
+        let not_pdf = write("short.txt", b"Hello, PDF");
+        assert!(!is_pdf(&not_pdf));
+    }
+
     #[test]
     fn test_is_pdf_bytes() {
         assert!(is_pdf_bytes(b"%PDF-1.4\n"));
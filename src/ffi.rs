@@ -18,6 +18,8 @@ use std::ffi::{c_char, c_int, CStr, CString};
 use std::panic::catch_unwind;
 use std::ptr;
 
+use rayon::prelude::*;
+
 use crate::model::Document;
 use crate::render::{JsonFormat, RenderOptions};
 
@@ -55,6 +57,161 @@ pub const UNPDF_FLAG_PARAGRAPH_SPACING: u32 = 4;
 pub const UNPDF_JSON_PRETTY: c_int = 0;
 pub const UNPDF_JSON_COMPACT: c_int = 1;
 
+/// Batch extraction modes for `unpdf_batch_extract`.
+pub const UNPDF_BATCH_MARKDOWN: c_int = 0;
+pub const UNPDF_BATCH_TEXT: c_int = 1;
+pub const UNPDF_BATCH_JSON: c_int = 2;
+
+/// Per-file outcome of `unpdf_batch_extract`.
+///
+/// Exactly one of `data` / `error` is non-null. Both strings are owned by the
+/// result array and released by `unpdf_free_batch_result`.
+#[repr(C)]
+pub struct UnpdfBatchResult {
+    /// 1 if the file was extracted, 0 otherwise.
+    pub success: c_int,
+    /// Extracted content, or null on failure.
+    pub data: *mut c_char,
+    /// Error message, or null on success.
+    pub error: *mut c_char,
+}
+
+impl UnpdfBatchResult {
+    fn new(result: Result<String, String>) -> Self {
+        let result = result
+            .and_then(|s| CString::new(s).map_err(|_| "output contains null byte".to_string()));
+        match result {
+            Ok(data) => Self {
+                success: 1,
+                data: data.into_raw(),
+                error: ptr::null_mut(),
+            },
+            Err(e) => Self {
+                success: 0,
+                data: ptr::null_mut(),
+                error: CString::new(e).unwrap_or_default().into_raw(),
+            },
+        }
+    }
+}
+
+/// Build Markdown render options from a bitwise OR of `UNPDF_FLAG_*` constants.
+fn markdown_options(flags: u32) -> RenderOptions {
+    let mut options = RenderOptions::new();
+
+    if flags & UNPDF_FLAG_FRONTMATTER != 0 {
+        options.include_frontmatter = true;
+    }
+    if flags & UNPDF_FLAG_ESCAPE_SPECIAL != 0 {
+        options.escape_special_chars = true;
+    }
+    // PARAGRAPH_SPACING: no direct field in unpdf's RenderOptions,
+    // treat as no-op for now
+
+    options
+}
+
+/// Map an `UNPDF_JSON_*` constant to a `JsonFormat`.
+fn json_format(format: c_int) -> JsonFormat {
+    if format == UNPDF_JSON_COMPACT {
+        JsonFormat::Compact
+    } else {
+        JsonFormat::Pretty
+    }
+}
+
+/// Hand a rendered string to the caller as an owned C string.
+///
+/// When `out_len` is given it receives the byte length of the string
+/// (excluding the terminating NUL), so callers can skip a `strlen` scan.
+fn string_result(
+    result: std::thread::Result<Result<String, String>>,
+    panic_message: &str,
+    out_len: Option<&mut usize>,
+) -> *mut c_char {
+    let result = result.map(|r| {
+        r.and_then(|s| CString::new(s).map_err(|_| "output contains null byte".to_string()))
+    });
+    c_string_result(result, panic_message, out_len)
+}
+
+/// Hand an already NUL-terminated result to the caller, recording errors and
+/// panics in the last-error slot. `out_len` is as for `string_result`.
+fn c_string_result(
+    result: std::thread::Result<Result<CString, String>>,
+    panic_message: &str,
+    out_len: Option<&mut usize>,
+) -> *mut c_char {
+    match result {
+        Ok(Ok(s)) => {
+            if let Some(out_len) = out_len {
+                *out_len = s.as_bytes().len();
+            }
+            s.into_raw()
+        }
+        Ok(Err(e)) => {
+            set_last_error(&e);
+            ptr::null_mut()
+        }
+        Err(_) => {
+            set_last_error(panic_message);
+            ptr::null_mut()
+        }
+    }
+}
+
+/// Render a document to Markdown, catching panics.
+///
+/// # Safety
+///
+/// `doc` must be a valid, non-null document handle.
+unsafe fn render_markdown(
+    doc: *const UnpdfDocument,
+    flags: u32,
+) -> std::thread::Result<Result<String, String>> {
+    catch_unwind(|| {
+        let document = &(*doc).inner;
+        crate::render::to_markdown(document, &markdown_options(flags)).map_err(|e| e.to_string())
+    })
+}
+
+/// Render a document to plain text, catching panics.
+///
+/// # Safety
+///
+/// `doc` must be a valid, non-null document handle.
+unsafe fn render_text(doc: *const UnpdfDocument) -> std::thread::Result<Result<String, String>> {
+    catch_unwind(|| {
+        let document = &(*doc).inner;
+        let options = RenderOptions::default();
+        crate::render::to_text(document, &options).map_err(|e| e.to_string())
+    })
+}
+
+/// Serialize a document to JSON as a C string, catching panics.
+///
+/// serde_json escapes U+0000 as `\u0000`, so the output never contains an
+/// interior NUL: serializing straight into a byte buffer and appending the
+/// terminator skips both the scan and the reallocation of `CString::new`.
+///
+/// # Safety
+///
+/// `doc` must be a valid, non-null document handle.
+unsafe fn render_json(
+    doc: *const UnpdfDocument,
+    format: c_int,
+) -> std::thread::Result<Result<CString, String>> {
+    catch_unwind(|| {
+        let document = &(*doc).inner;
+        let mut buf = Vec::new();
+        crate::render::write_json(&mut buf, document, json_format(format))
+            .map_err(|e| e.to_string())?;
+        buf.push(0);
+        // SAFETY: JSON output contains no NUL bytes; the only one is the terminator.
+        Ok(CString::from_vec_with_nul_unchecked(buf))
+    })
+}
+
 /// Get the version of the library.
 ///
 /// # Safety
@@ -155,6 +312,40 @@ pub unsafe extern "C" fn unpdf_parse_bytes(data: *const u8, len: usize) -> *mut
     }
 }
 
+/// Check whether a file looks like a PDF without parsing it.
+///
+/// Reads only the `%PDF-X.Y` header, so the cost is independent of the file
+/// size. A file that passes may still fail to parse; use `unpdf_parse_file`
+/// for a full check.
+///
+/// # Safety
+///
+/// - `path` must be a valid null-terminated UTF-8 string.
+/// - Returns 1 if the header is a valid PDF header, 0 otherwise (including
+///   when the file cannot be read).
+#[no_mangle]
+pub unsafe extern "C" fn unpdf_probe(path: *const c_char) -> c_int {
+    clear_last_error();
+
+    if path.is_null() {
+        set_last_error("path is null");
+        return 0;
+    }
+
+    let result = catch_unwind(|| match CStr::from_ptr(path).to_str() {
+        Ok(path_str) => crate::is_pdf(path_str),
+        Err(_) => false,
+    });
+
+    match result {
+        Ok(is_pdf) => is_pdf as c_int,
+        Err(_) => {
+            set_last_error("panic occurred");
+            0
+        }
+    }
+}
+
 /// Free a document handle.
 ///
 /// # Safety
@@ -185,40 +376,50 @@ pub unsafe extern "C" fn unpdf_to_markdown(doc: *const UnpdfDocument, flags: u32
         return ptr::null_mut();
     }
 
-    let result = catch_unwind(|| {
-        let document = &(*doc).inner;
-
-        let mut options = RenderOptions::new();
+    string_result(
+        render_markdown(doc, flags),
+        "panic occurred during rendering",
+        None,
+    )
+}
 
-        if flags & UNPDF_FLAG_FRONTMATTER != 0 {
-            options.include_frontmatter = true;
-        }
-        if flags & UNPDF_FLAG_ESCAPE_SPECIAL != 0 {
-            options.escape_special_chars = true;
-        }
-        // PARAGRAPH_SPACING: no direct field in unpdf's RenderOptions,
-        // treat as no-op for now
+/// Convert a document to Markdown, also reporting the output length.
+///
+/// Same as `unpdf_to_markdown`, but the byte length of the returned string
+/// (excluding the terminating NUL) is written to `out_len`, so callers can
+/// decode it without scanning for the terminator.
+///
+/// # Safety
+///
+/// - `doc` must be a valid document handle.
+/// - `flags` is a bitwise OR of `UNPDF_FLAG_*` constants.
+/// - `out_len` must be a valid pointer; it is set to 0 on error.
+/// - Returns null on error. Use `unpdf_last_error` to get the error message.
+/// - The returned string must be freed with `unpdf_free_string`.
+#[no_mangle]
+pub unsafe extern "C" fn unpdf_to_markdown_buf(
+    doc: *const UnpdfDocument,
+    flags: u32,
+    out_len: *mut usize,
+) -> *mut c_char {
+    clear_last_error();
 
-        crate::render::to_markdown(document, &options).map_err(|e| e.to_string())
-    });
+    if out_len.is_null() {
+        set_last_error("out_len is null");
+        return ptr::null_mut();
+    }
+    *out_len = 0;
 
-    match result {
-        Ok(Ok(md)) => match CString::new(md) {
-            Ok(s) => s.into_raw(),
-            Err(_) => {
-                set_last_error("output contains null byte");
-                ptr::null_mut()
-            }
-        },
-        Ok(Err(e)) => {
-            set_last_error(&e);
-            ptr::null_mut()
-        }
-        Err(_) => {
-            set_last_error("panic occurred during rendering");
-            ptr::null_mut()
-        }
+    if doc.is_null() {
+        set_last_error("document is null");
+        return ptr::null_mut();
     }
+
+    string_result(
+        render_markdown(doc, flags),
+        "panic occurred during rendering",
+        Some(&mut *out_len),
+    )
 }
 
 /// Convert a document to plain text.
@@ -237,29 +438,43 @@ pub unsafe extern "C" fn unpdf_to_text(doc: *const UnpdfDocument) -> *mut c_char
         return ptr::null_mut();
     }
 
-    let result = catch_unwind(|| {
-        let document = &(*doc).inner;
-        let options = RenderOptions::default();
-        crate::render::to_text(document, &options).map_err(|e| e.to_string())
-    });
+    string_result(render_text(doc), "panic occurred during rendering", None)
+}
 
-    match result {
-        Ok(Ok(text)) => match CString::new(text) {
-            Ok(s) => s.into_raw(),
-            Err(_) => {
-                set_last_error("output contains null byte");
-                ptr::null_mut()
-            }
-        },
-        Ok(Err(e)) => {
-            set_last_error(&e);
-            ptr::null_mut()
-        }
-        Err(_) => {
-            set_last_error("panic occurred during rendering");
-            ptr::null_mut()
-        }
+/// Convert a document to plain text, also reporting the output length.
+///
+/// Same as `unpdf_to_text`, but the byte length of the returned string
+/// (excluding the terminating NUL) is written to `out_len`.
+///
+/// # Safety
+///
+/// - `doc` must be a valid document handle.
+/// - `out_len` must be a valid pointer; it is set to 0 on error.
+/// - Returns null on error. Use `unpdf_last_error` to get the error message.
+/// - The returned string must be freed with `unpdf_free_string`.
+#[no_mangle]
+pub unsafe extern "C" fn unpdf_to_text_buf(
+    doc: *const UnpdfDocument,
+    out_len: *mut usize,
+) -> *mut c_char {
+    clear_last_error();
+
+    if out_len.is_null() {
+        set_last_error("out_len is null");
+        return ptr::null_mut();
+    }
+    *out_len = 0;
+
+    if doc.is_null() {
+        set_last_error("document is null");
+        return ptr::null_mut();
     }
+
+    string_result(
+        render_text(doc),
+        "panic occurred during rendering",
+        Some(&mut *out_len),
+    )
 }
 
 /// Convert a document to JSON.
@@ -279,33 +494,50 @@ pub unsafe extern "C" fn unpdf_to_json(doc: *const UnpdfDocument, format: c_int)
         return ptr::null_mut();
     }
 
-    let result = catch_unwind(|| {
-        let document = &(*doc).inner;
-        let json_format = if format == UNPDF_JSON_COMPACT {
-            JsonFormat::Compact
-        } else {
-            JsonFormat::Pretty
-        };
-        crate::render::to_json(document, json_format).map_err(|e| e.to_string())
-    });
+    c_string_result(
+        render_json(doc, format),
+        "panic occurred during rendering",
+        None,
+    )
+}
 
-    match result {
-        Ok(Ok(json)) => match CString::new(json) {
-            Ok(s) => s.into_raw(),
-            Err(_) => {
-                set_last_error("output contains null byte");
-                ptr::null_mut()
-            }
-        },
-        Ok(Err(e)) => {
-            set_last_error(&e);
-            ptr::null_mut()
-        }
-        Err(_) => {
-            set_last_error("panic occurred during rendering");
-            ptr::null_mut()
-        }
+/// Convert a document to JSON and report the byte length of the result.
+///
+/// Same output as `unpdf_to_json`; the length lets bindings decode the
+/// result without a `strlen` scan.
+///
+/// # Safety
+///
+/// - `doc` must be a valid document handle.
+/// - `format` is one of `UNPDF_JSON_PRETTY` or `UNPDF_JSON_COMPACT`.
+/// - `out_len` must be a valid pointer. It receives the byte length of the
+///   returned string (excluding the terminating NUL), or 0 on error.
+/// - Returns null on error. Use `unpdf_last_error` to get the error message.
+/// - The returned string must be freed with `unpdf_free_string`.
+#[no_mangle]
+pub unsafe extern "C" fn unpdf_to_json_buf(
+    doc: *const UnpdfDocument,
+    format: c_int,
+    out_len: *mut usize,
+) -> *mut c_char {
+    clear_last_error();
+
+    if out_len.is_null() {
+        set_last_error("out_len is null");
+        return ptr::null_mut();
     }
+    *out_len = 0;
+
+    if doc.is_null() {
+        set_last_error("document is null");
+        return ptr::null_mut();
+    }
+
+    c_string_result(
+        render_json(doc, format),
+        "panic occurred during rendering",
+        Some(&mut *out_len),
+    )
 }
 
 /// Get the plain text content of a document.
@@ -467,6 +699,106 @@ pub unsafe extern "C" fn unpdf_get_author(doc: *const UnpdfDocument) -> *mut c_c
     }
 }
 
+/// Null-terminated table of C string pointers that can live in a `static`.
+#[repr(transparent)]
+struct KeyTable<const N: usize>([*const c_char; N]);
+
+// SAFETY: the table only holds pointers to immutable `'static` string literals.
+unsafe impl<const N: usize> Sync for KeyTable<N> {}
+
+/// Keys accepted by `unpdf_get_metadata`, terminated by a null pointer.
+static METADATA_KEYS: KeyTable<10> = KeyTable([
+    b"title\0".as_ptr() as *const c_char,
+    b"author\0".as_ptr() as *const c_char,
+    b"subject\0".as_ptr() as *const c_char,
+    b"keywords\0".as_ptr() as *const c_char,
+    b"creator\0".as_ptr() as *const c_char,
+    b"producer\0".as_ptr() as *const c_char,
+    b"created\0".as_ptr() as *const c_char,
+    b"modified\0".as_ptr() as *const c_char,
+    b"pdf_version\0".as_ptr() as *const c_char,
+    ptr::null(),
+]);
+
+/// Get the metadata keys understood by `unpdf_get_metadata`.
+///
+/// Lets bindings enumerate document metadata without hard-coding the field
+/// list, so new fields do not require binding changes.
+///
+/// # Safety
+///
+/// Returns a static, null-terminated array of static strings that must not
+/// be freed.
+#[no_mangle]
+pub extern "C" fn unpdf_metadata_keys() -> *const *const c_char {
+    METADATA_KEYS.0.as_ptr()
+}
+
+/// Get a single document metadata field by key.
+///
+/// Keys are listed by `unpdf_metadata_keys`. Dates (`created`, `modified`)
+/// are formatted as RFC 3339.
+///
+/// # Safety
+///
+/// - `doc` must be a valid document handle.
+/// - `key` must be a valid null-terminated UTF-8 string.
+/// - Returns null if the field is not set, without setting an error. For an
+///   unknown key, or a value containing a NUL byte (which a C string cannot
+///   carry), it also returns null and sets the error message (see
+///   `unpdf_last_error`).
+/// - The returned string must be freed with `unpdf_free_string`.
+#[no_mangle]
+pub unsafe extern "C" fn unpdf_get_metadata(
+    doc: *const UnpdfDocument,
+    key: *const c_char,
+) -> *mut c_char {
+    clear_last_error();
+
+    if doc.is_null() {
+        set_last_error("document is null");
+        return ptr::null_mut();
+    }
+
+    if key.is_null() {
+        set_last_error("key is null");
+        return ptr::null_mut();
+    }
+
+    let result = catch_unwind(|| {
+        let key = CStr::from_ptr(key).to_str().map_err(|e| e.to_string())?;
+        let metadata = &(*doc).inner.metadata;
+        let value = match key {
+            "title" => metadata.title.clone(),
+            "author" => metadata.author.clone(),
+            "subject" => metadata.subject.clone(),
+            "keywords" => metadata.keywords.clone(),
+            "creator" => metadata.creator.clone(),
+            "producer" => metadata.producer.clone(),
+            "created" => metadata.created.map(|d| d.to_rfc3339()),
+            "modified" => metadata.modified.map(|d| d.to_rfc3339()),
+            "pdf_version" => Some(metadata.pdf_version.clone()).filter(|v| !v.is_empty()),
+            _ => return Err(format!("unknown metadata key: {}", key)),
+        };
+        value
+            .map(|v| CString::new(v).map_err(|_| format!("metadata {} contains null byte", key)))
+            .transpose()
+    });
+
+    match result {
+        Ok(Ok(Some(s))) => s.into_raw(),
+        Ok(Ok(None)) => ptr::null_mut(),
+        Ok(Err(e)) => {
+            set_last_error(&e);
+            ptr::null_mut()
+        }
+        Err(_) => {
+            set_last_error("panic occurred");
+            ptr::null_mut()
+        }
+    }
+}
+
 /// Get all resource IDs as a JSON array.
 ///
 /// # Safety
@@ -794,19 +1126,12 @@ pub unsafe extern "C" fn unpdf_page_to_markdown(
             )
         })?;
 
-        let mut options = RenderOptions::new();
-        if flags & UNPDF_FLAG_FRONTMATTER != 0 {
-            options.include_frontmatter = true;
-        }
-        if flags & UNPDF_FLAG_ESCAPE_SPECIAL != 0 {
-            options.escape_special_chars = true;
-        }
-
         // Create a single-page document for rendering
         let mut single_page_doc = Document::new();
         single_page_doc.add_page(page.clone());
 
-        crate::render::to_markdown(&single_page_doc, &options).map_err(|e| e.to_string())
+        crate::render::to_markdown(&single_page_doc, &markdown_options(flags))
+            .map_err(|e| e.to_string())
     });
 
     match result {
@@ -880,6 +1205,80 @@ pub unsafe extern "C" fn unpdf_page_to_text(
     }
 }
 
+/// Parse and render one file for `unpdf_batch_extract`.
+fn batch_extract_one(path: &str, mode: c_int, flags: u32) -> Result<String, String> {
+    let document = crate::parse_file(path).map_err(|e| e.to_string())?;
+    match mode {
+        UNPDF_BATCH_TEXT => crate::render::to_text(&document, &RenderOptions::default()),
+        UNPDF_BATCH_JSON => crate::render::to_json(&document, json_format(flags as c_int)),
+        _ => crate::render::to_markdown(&document, &markdown_options(flags)),
+    }
+    .map_err(|e| e.to_string())
+}
+
+/// Parse and render many files in one call.
+///
+/// Files are processed in parallel on the Rayon pool. A failure on one file
+/// does not affect the others: it is reported in that file's result entry.
+///
+/// # Safety
+///
+/// - `paths` must point to `count` null-terminated UTF-8 strings.
+/// - `mode` is one of `UNPDF_BATCH_*`.
+/// - `flags` is a bitwise OR of `UNPDF_FLAG_*` constants for
+///   `UNPDF_BATCH_MARKDOWN`, one of `UNPDF_JSON_*` for `UNPDF_BATCH_JSON`, and
+///   ignored for `UNPDF_BATCH_TEXT`.
+/// - Returns an array of `count` results in input order, or null on error
+///   (null `paths`, unknown `mode`). Use `unpdf_last_error` to get the error message.
+/// - The returned array must be freed with `unpdf_free_batch_result`.
+#[no_mangle]
+pub unsafe extern "C" fn unpdf_batch_extract(
+    paths: *const *const c_char,
+    count: usize,
+    mode: c_int,
+    flags: u32,
+) -> *mut UnpdfBatchResult {
+    clear_last_error();
+
+    if paths.is_null() && count > 0 {
+        set_last_error("paths is null");
+        return ptr::null_mut();
+    }
+
+    if !(UNPDF_BATCH_MARKDOWN..=UNPDF_BATCH_JSON).contains(&mode) {
+        set_last_error(&format!("invalid batch mode: {}", mode));
+        return ptr::null_mut();
+    }
+
+    // Resolve the C strings up front: raw pointers cannot cross into the pool.
+    let paths: Vec<Result<&str, String>> = if count == 0 {
+        Vec::new()
+    } else {
+        std::slice::from_raw_parts(paths, count)
+            .iter()
+            .map(|&p| {
+                if p.is_null() {
+                    Err("path is null".to_string())
+                } else {
+                    CStr::from_ptr(p).to_str().map_err(|e| e.to_string())
+                }
+            })
+            .collect()
+    };
+
+    let outcomes: Vec<Result<String, String>> = paths
+        .par_iter()
+        .map(|path| {
+            let path = path.clone()?;
+            catch_unwind(|| batch_extract_one(path, mode, flags))
+                .unwrap_or_else(|_| Err("panic occurred during extraction".to_string()))
+        })
+        .collect();
+
+    let results: Vec<UnpdfBatchResult> = outcomes.into_iter().map(UnpdfBatchResult::new).collect();
+    Box::into_raw(results.into_boxed_slice()) as *mut UnpdfBatchResult
+}
+
 /// Free a string allocated by this library.
 ///
 /// # Safety
@@ -893,6 +1292,27 @@ pub unsafe extern "C" fn unpdf_free_string(s: *mut c_char) {
     }
 }
 
+/// Free several strings allocated by this library in one call.
+///
+/// Equivalent to calling `unpdf_free_string` on each element, but crosses the
+/// FFI boundary once — useful for bindings that collect many results.
+///
+/// # Safety
+///
+/// - `ptrs` must point to an array of `count` pointers, each returned by an
+///   unpdf function or null. `ptrs` itself may be null when `count` is 0.
+/// - After calling this function, the strings are invalid and must not be
+///   used. The array itself is owned by the caller and is left untouched.
+#[no_mangle]
+pub unsafe extern "C" fn unpdf_free_many(ptrs: *const *mut c_char, count: usize) {
+    if ptrs.is_null() {
+        return;
+    }
+    for &s in std::slice::from_raw_parts(ptrs, count) {
+        unpdf_free_string(s);
+    }
+}
+
 /// Free binary data allocated by `unpdf_get_resource_data`.
 ///
 /// # Safety
@@ -907,6 +1327,26 @@ pub unsafe extern "C" fn unpdf_free_bytes(data: *mut u8, len: usize) {
     }
 }
 
+/// Free a result array returned by `unpdf_batch_extract`, including every
+/// string it owns.
+///
+/// # Safety
+///
+/// - `results` must be a pointer returned by `unpdf_batch_extract`, or null.
+/// - `count` must be the `count` passed to `unpdf_batch_extract`.
+/// - After calling this function, the pointer is invalid and must not be used.
+#[no_mangle]
+pub unsafe extern "C" fn unpdf_free_batch_result(results: *mut UnpdfBatchResult, count: usize) {
+    if results.is_null() {
+        return;
+    }
+    let results = Box::from_raw(ptr::slice_from_raw_parts_mut(results, count));
+    for result in results.iter() {
+        unpdf_free_string(result.data);
+        unpdf_free_string(result.error);
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -930,6 +1370,25 @@ mod tests {
         assert!(!error.is_null());
     }
 
+    #[test]
+    fn test_probe() {
+        let dir = tempfile::tempdir().unwrap();
+        let pdf = dir.path().join("header.pdf");
+        let txt = dir.path().join("plain.txt");
+        // Only the header is read, so a truncated PDF still probes as PDF.
+        std::fs::write(&pdf, b"%PDF-1.7\n").unwrap();
+        std::fs::write(&txt, b"This is not a PDF").unwrap();
+
+        let probe = |path: &std::path::Path| {
+            let path = CString::new(path.to_str().unwrap()).unwrap();
+            unsafe { unpdf_probe(path.as_ptr()) }
+        };
+        assert_eq!(probe(&pdf), 1);
+        assert_eq!(probe(&txt), 0);
+        assert_eq!(probe(&dir.path().join("missing.pdf")), 0);
+        assert_eq!(unsafe { unpdf_probe(ptr::null()) }, 0);
+    }
+
     #[test]
     fn test_parse_invalid_path() {
         let path = CString::new("nonexistent.pdf").unwrap();
@@ -985,6 +1444,16 @@ mod tests {
         let json = unsafe { unpdf_to_json(ptr::null(), 0) };
         assert!(json.is_null());
 
+        let mut len = 1usize;
+        let md = unsafe { unpdf_to_markdown_buf(ptr::null(), 0, &mut len) };
+        assert!(md.is_null());
+        assert_eq!(len, 0);
+
+        let mut len = 1usize;
+        let text = unsafe { unpdf_to_text_buf(ptr::null(), &mut len) };
+        assert!(text.is_null());
+        assert_eq!(len, 0);
+
         let count = unsafe { unpdf_section_count(ptr::null()) };
         assert_eq!(count, -1);
 
@@ -992,6 +1461,42 @@ mod tests {
         assert_eq!(res_count, -1);
     }
 
+    #[test]
+    fn test_metadata_keys() {
+        let mut keys = Vec::new();
+        unsafe {
+            let mut p = unpdf_metadata_keys();
+            while !(*p).is_null() {
+                keys.push(CStr::from_ptr(*p).to_str().unwrap());
+                p = p.add(1);
+            }
+        }
+        assert!(keys.contains(&"title"));
+        assert!(keys.contains(&"author"));
+
+        let title = CString::new("title").unwrap();
+        let value = unsafe { unpdf_get_metadata(ptr::null(), title.as_ptr()) };
+        assert!(value.is_null());
+    }
+
+    #[test]
+    fn test_metadata_with_null_byte_sets_error() {
+        let mut inner = Document::new();
+        inner.metadata.title = Some("bad\0title".to_string());
+        let doc = UnpdfDocument { inner };
+        let title = CString::new("title").unwrap();
+        let author = CString::new("author").unwrap();
+        unsafe {
+            assert!(unpdf_get_metadata(&doc, title.as_ptr()).is_null());
+            let error = CStr::from_ptr(unpdf_last_error()).to_str().unwrap();
+            assert!(error.contains("null byte"));
+
+            // An unset field is null without an error
+            assert!(unpdf_get_metadata(&doc, author.as_ptr()).is_null());
+            assert!(unpdf_last_error().is_null());
+        }
+    }
+
     #[test]
     fn test_page_null_document() {
         let md = unsafe { unpdf_page_to_markdown(ptr::null(), 1, 0) };
@@ -1007,6 +1512,49 @@ mod tests {
         unsafe {
             unpdf_free_document(ptr::null_mut());
             unpdf_free_string(ptr::null_mut());
+            unpdf_free_batch_result(ptr::null_mut(), 0);
+            unpdf_free_many(ptr::null(), 0);
+        }
+    }
+
+    #[test]
+    fn test_free_many() {
+        let ptrs = [
+            CString::new("a").unwrap().into_raw(),
+            ptr::null_mut(),
+            CString::new("b").unwrap().into_raw(),
+        ];
+        unsafe { unpdf_free_many(ptrs.as_ptr(), ptrs.len()) };
+    }
+
+    #[test]
+    fn test_batch_invalid_arguments() {
+        let path = CString::new("nonexistent.pdf").unwrap();
+        let paths = [path.as_ptr()];
+
+        let results = unsafe { unpdf_batch_extract(ptr::null(), 1, UNPDF_BATCH_MARKDOWN, 0) };
+        assert!(results.is_null());
+        assert!(!unpdf_last_error().is_null());
+
+        let results = unsafe { unpdf_batch_extract(paths.as_ptr(), 1, 42, 0) };
+        assert!(results.is_null());
+        assert!(!unpdf_last_error().is_null());
+    }
+
+    #[test]
+    fn test_batch_reports_per_file_errors() {
+        let missing = CString::new("nonexistent.pdf").unwrap();
+        let paths = [missing.as_ptr(), ptr::null()];
+
+        unsafe {
+            let results = unpdf_batch_extract(paths.as_ptr(), 2, UNPDF_BATCH_TEXT, 0);
+            assert!(!results.is_null());
+            for result in std::slice::from_raw_parts(results, 2) {
+                assert_eq!(result.success, 0);
+                assert!(result.data.is_null());
+                assert!(!result.error.is_null());
+            }
+            unpdf_free_batch_result(results, 2);
         }
     }
 }
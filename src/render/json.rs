@@ -23,6 +23,19 @@ pub fn to_json(doc: &Document, format: JsonFormat) -> Result<String> {
     result.map_err(|e| Error::Render(format!("JSON serialization error: {}", e)))
 }
 
+/// Write a document as JSON to `writer`.
+///
+/// Same output as [`to_json`], serialized straight into the caller's writer
+/// (e.g. a buffer it will hand off without copying).
+pub fn write_json<W: std::io::Write>(writer: W, doc: &Document, format: JsonFormat) -> Result<()> {
+    let result = match format {
+        JsonFormat::Pretty => serde_json::to_writer_pretty(writer, doc),
+        JsonFormat::Compact => serde_json::to_writer(writer, doc),
+    };
+
+    result.map_err(|e| Error::Render(format!("JSON serialization error: {}", e)))
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -42,6 +55,22 @@ mod tests {
         assert!(json.contains('\n')); // Pretty has newlines
     }
 
+    #[test]
+    fn test_write_json_matches_to_json() {
+        let mut doc = Document::new();
+        let mut page = Page::letter(1);
+        page.add_paragraph(Paragraph::with_text("Hello \u{0}"));
+        doc.add_page(page);
+
+        for format in [JsonFormat::Pretty, JsonFormat::Compact] {
+            let mut buf = Vec::new();
+            write_json(&mut buf, &doc, format).unwrap();
+            assert_eq!(buf, to_json(&doc, format).unwrap().into_bytes());
+            // NUL characters are escaped, never written raw
+            assert!(!buf.contains(&0));
+        }
+    }
+
     #[test]
     fn test_to_json_compact() {
         let mut doc = Document::new();
@@ -10,7 +10,7 @@ mod text;
 pub mod visitor;
 
 pub use cleanup::{CleanupOptions, CleanupPipeline, CleanupPreset};
-pub use json::{to_json, JsonFormat};
+pub use json::{to_json, write_json, JsonFormat};
 pub use markdown::{to_markdown, to_markdown_with_stats, MarkdownRenderer};
 pub use options::{HeadingConfig, PageMarkerStyle, PageSelection, RenderOptions, TableFallback};
 pub use result::{ExtractionStats, RenderResult};
@@ -1,4 +1,4 @@
-//! Shared synthetic PDF fixture builders for integration tests.
+//! Shared synthetic PDF fixture builders and FFI helpers for integration tests.
 //!
 //! 스캐너가 만드는 구조(전면 이미지 + 텍스트 레이어 유무)를 최소로 재현한다.
 #![allow(dead_code)] // 각 테스트 파일이 필요한 빌더만 사용한다.
@@ -71,6 +71,18 @@ pub fn mixed_pdf() -> Vec<u8> {
     assemble(objects)
 }
 
+/// Consume an FFI string result into an owned Rust String.
+///
+/// # Safety
+/// `ptr` must be a non-null string returned by the `unpdf_*` C-ABI and not yet freed.
+#[cfg(feature = "ffi")]
+pub unsafe fn take_string(ptr: *mut std::os::raw::c_char) -> String {
+    assert!(!ptr.is_null());
+    let s = std::ffi::CStr::from_ptr(ptr).to_str().unwrap().to_owned();
+    unpdf::ffi::unpdf_free_string(ptr);
+    s
+}
+
 /// A 1×1 grey image XObject — the CTM it is drawn with does the scaling.
 fn gray_pixel_image() -> Vec<u8> {
     stream_object(
@@ -0,0 +1,55 @@
+//! FFI batch surface: `unpdf_batch_extract` / `unpdf_free_batch_result`.
+#![cfg(feature = "ffi")]
+
+mod common;
+
+use std::ffi::{CStr, CString};
+use std::os::raw::c_char;
+
+use common::{image_only_pdf, text_pdf};
+use unpdf::ffi::{
+    unpdf_batch_extract, unpdf_free_batch_result, UNPDF_BATCH_MARKDOWN, UNPDF_BATCH_TEXT,
+};
+
+fn write_fixture(dir: &tempfile::TempDir, name: &str, bytes: &[u8]) -> CString {
+    let path = dir.path().join(name);
+    std::fs::write(&path, bytes).unwrap();
+    CString::new(path.to_str().unwrap()).unwrap()
+}
+
+#[test]
+fn batch_preserves_input_order_and_isolates_failures() {
+    let dir = tempfile::tempdir().unwrap();
+    let text = write_fixture(&dir, "text.pdf", &text_pdf());
+    let scan = write_fixture(&dir, "scan.pdf", &image_only_pdf());
+    let missing = CString::new(dir.path().join("missing.pdf").to_str().unwrap()).unwrap();
+    let paths: [*const c_char; 3] = [text.as_ptr(), missing.as_ptr(), scan.as_ptr()];
+
+    unsafe {
+        let results = unpdf_batch_extract(paths.as_ptr(), paths.len(), UNPDF_BATCH_TEXT, 0);
+        assert!(!results.is_null());
+        let slice = std::slice::from_raw_parts(results, paths.len());
+
+        assert_eq!(slice[0].success, 1);
+        let first = CStr::from_ptr(slice[0].data).to_str().unwrap();
+        assert!(first.contains("Hello World"));
+
+        assert_eq!(slice[1].success, 0);
+        assert!(slice[1].data.is_null());
+        assert!(!slice[1].error.is_null());
+
+        assert_eq!(slice[2].success, 1);
+        assert!(slice[2].error.is_null());
+
+        unpdf_free_batch_result(results, paths.len());
+    }
+}
+
+#[test]
+fn batch_empty_input() {
+    unsafe {
+        let results = unpdf_batch_extract(std::ptr::null(), 0, UNPDF_BATCH_MARKDOWN, 0);
+        assert!(!results.is_null());
+        unpdf_free_batch_result(results, 0);
+    }
+}
@@ -6,24 +6,15 @@
 
 mod common;
 
-use std::ffi::CStr;
-use std::os::raw::c_char;
+use std::ffi::{CStr, CString};
 use std::ptr;
 
-use common::{image_only_pdf, text_pdf};
+use common::{image_only_pdf, take_string, text_pdf};
 use unpdf::ffi::{
-    unpdf_free_document, unpdf_free_string, unpdf_get_extraction_quality, unpdf_last_error,
-    unpdf_page_stats, unpdf_parse_bytes,
+    unpdf_free_document, unpdf_free_string, unpdf_get_extraction_quality, unpdf_get_metadata,
+    unpdf_last_error, unpdf_metadata_keys, unpdf_page_stats, unpdf_parse_bytes,
 };
 
-/// Helper: consume an FFI string result into an owned Rust String.
-unsafe fn take_string(ptr: *mut c_char) -> String {
-    assert!(!ptr.is_null());
-    let s = CStr::from_ptr(ptr).to_str().unwrap().to_owned();
-    unpdf_free_string(ptr);
-    s
-}
-
 #[test]
 fn extraction_quality_reports_scan_pdf() {
     let bytes = image_only_pdf();
@@ -111,3 +102,40 @@ fn null_document_returns_null() {
         assert!(unpdf_page_stats(ptr::null(), 1).is_null());
     }
 }
+
+#[test]
+fn metadata_by_key() {
+    let bytes = text_pdf();
+    unsafe {
+        let doc = unpdf_parse_bytes(bytes.as_ptr(), bytes.len());
+        assert!(!doc.is_null());
+
+        // Every advertised key is readable; unset fields are null without an error.
+        let mut keys = unpdf_metadata_keys();
+        let mut count = 0;
+        while !(*keys).is_null() {
+            let value = unpdf_get_metadata(doc, *keys);
+            if value.is_null() {
+                assert!(unpdf_last_error().is_null());
+            } else {
+                unpdf_free_string(value);
+            }
+            keys = keys.add(1);
+            count += 1;
+        }
+        assert_eq!(count, 9);
+
+        let version = CString::new("pdf_version").unwrap();
+        assert_eq!(
+            take_string(unpdf_get_metadata(doc, version.as_ptr())),
+            "1.4"
+        );
+
+        let unknown = CString::new("no_such_key").unwrap();
+        assert!(unpdf_get_metadata(doc, unknown.as_ptr()).is_null());
+        let err = CStr::from_ptr(unpdf_last_error()).to_str().unwrap();
+        assert!(err.contains("no_such_key"));
+
+        unpdf_free_document(doc);
+    }
+}
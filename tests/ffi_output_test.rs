@@ -0,0 +1,54 @@
+//! FFI output strings: the `*_buf` entry points report the byte length of
+//! what they return, matching the NUL-terminated variants.
+#![cfg(feature = "ffi")]
+
+mod common;
+
+use common::{take_string, text_pdf};
+use unpdf::ffi::{
+    unpdf_free_document, unpdf_parse_bytes, unpdf_to_json, unpdf_to_json_buf, unpdf_to_markdown,
+    unpdf_to_markdown_buf, unpdf_to_text, unpdf_to_text_buf, UNPDF_JSON_COMPACT, UNPDF_JSON_PRETTY,
+};
+
+#[test]
+fn buf_variants_report_length() {
+    let bytes = text_pdf();
+    unsafe {
+        let doc = unpdf_parse_bytes(bytes.as_ptr(), bytes.len());
+        assert!(!doc.is_null());
+
+        let mut len = 0usize;
+        let md = take_string(unpdf_to_markdown_buf(doc, 0, &mut len));
+        assert_eq!(md.len(), len);
+        assert_eq!(md, take_string(unpdf_to_markdown(doc, 0)));
+
+        let mut len = 0usize;
+        let text = take_string(unpdf_to_text_buf(doc, &mut len));
+        assert_eq!(text.len(), len);
+        assert_eq!(text, take_string(unpdf_to_text(doc)));
+
+        for format in [UNPDF_JSON_PRETTY, UNPDF_JSON_COMPACT] {
+            let mut len = 0usize;
+            let json = take_string(unpdf_to_json_buf(doc, format, &mut len));
+            assert_eq!(json.len(), len);
+            assert_eq!(json, take_string(unpdf_to_json(doc, format)));
+        }
+
+        unpdf_free_document(doc);
+    }
+}
+
+#[test]
+fn buf_variants_reject_null_out_len() {
+    let bytes = text_pdf();
+    unsafe {
+        let doc = unpdf_parse_bytes(bytes.as_ptr(), bytes.len());
+        assert!(!doc.is_null());
+
+        assert!(unpdf_to_markdown_buf(doc, 0, std::ptr::null_mut()).is_null());
+        assert!(unpdf_to_text_buf(doc, std::ptr::null_mut()).is_null());
+        assert!(unpdf_to_json_buf(doc, UNPDF_JSON_COMPACT, std::ptr::null_mut()).is_null());
+
+        unpdf_free_document(doc);
+    }
+}